@@ -59,7 +59,7 @@ run_api_tests() {
 run_backend_tests() {
     echo -e "${YELLOW}Running backend tests...${NC}"
     cd "${PROJECT_ROOT}/src/backend"
-    pytest tests/ --cov=src --cov-report=html:${TEST_RESULTS_DIR}/backend_coverage
+    pytest tests/ -n auto --dist=loadfile --cov=src --cov-report=html:${TEST_RESULTS_DIR}/backend_coverage
 }
 
 # Function to run database tests
@@ -17,23 +17,32 @@ Date: 2023-05-20
 """
 
 import sys
-from typing import Tuple, List, Dict, Any
-from tqdm import tqdm
+import asyncio
+import concurrent.futures
+from typing import TYPE_CHECKING, Tuple, List, Dict, Any
 
 # Internal imports
+# Service modules pull in pandas, pyarrow and boto3; they are imported in
+# setup_services so that --help and argument errors return immediately.
 from src.cli.command_line_parser import CommandLineParser
-from src.core.input_processor import InputProcessor
-from src.core.batch_processor import BatchProcessor
-from src.services.aws_service import AWSService
 from src.utils.logger import logger, log_decorator
+from src.utils.async_pipeline import count_items
 from src.utils.error_handler import handle_error, ApiRequestError, ValidationError, FileSystemError
 from src.config.app_config import AppConfig
 
+if TYPE_CHECKING:
+    from src.core.input_processor import InputProcessor
+    from src.core.batch_processor import BatchProcessor
+    from src.services.aws_service import AWSService
+
 @log_decorator(level="INFO")
-def setup_services(config: AppConfig) -> Tuple[InputProcessor, BatchProcessor, AWSService]:
+def setup_services(config: AppConfig) -> Tuple['InputProcessor', 'BatchProcessor', 'AWSService']:
     """
     Initializes and configures all required services for the application.
 
+    The services are constructed concurrently so that client setup (boto3 S3
+    client, transfer manager) overlaps instead of running back to back.
+
     Args:
         config (AppConfig): Application configuration object.
 
@@ -45,17 +54,25 @@ def setup_services(config: AppConfig) -> Tuple[InputProcessor, BatchProcessor, A
         ValidationError: If there's an issue with input validation.
         FileSystemError: If there's an issue with file system operations.
     """
+    from src.core.input_processor import InputProcessor
+    from src.core.file_manager import FileManager
+    from src.core.batch_processor import BatchProcessor
+    from src.services.aws_service import AWSService
+
     try:
-        input_processor = InputProcessor(config)
-        batch_processor = BatchProcessor(config)
-        aws_service = AWSService(config)
-        return input_processor, batch_processor, aws_service
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            input_processor_future = executor.submit(InputProcessor, config)
+            file_manager_future = executor.submit(FileManager, config)
+            aws_service_future = executor.submit(AWSService, config)
+            input_processor = input_processor_future.result()
+            batch_processor = BatchProcessor(config, input_processor, file_manager_future.result())
+            return input_processor, batch_processor, aws_service_future.result()
     except Exception as e:
         logger.error(f"Error setting up services: {str(e)}")
         raise
 
 @log_decorator(level="INFO")
-def process_commands(input_processor: InputProcessor, batch_processor: BatchProcessor, aws_service: AWSService, config: AppConfig) -> Dict[str, Any]:
+def process_commands(input_processor: 'InputProcessor', batch_processor: 'BatchProcessor', aws_service: 'AWSService', config: AppConfig) -> Dict[str, Any]:
     """
     Processes the input commands, generates variations, creates audio files, and uploads to AWS S3.
 
@@ -78,28 +95,44 @@ def process_commands(input_processor: InputProcessor, batch_processor: BatchProc
         commands = input_processor.process_input_file(config.input_file)
         logger.info(f"Processed {len(commands)} commands from input file")
 
-        # Generate variations
-        variations = batch_processor.generate_variations(commands)
-        logger.info(f"Generated {len(variations)} variations")
-
-        # Create audio files
-        audio_files = batch_processor.create_audio_files(variations)
-        logger.info(f"Created {len(audio_files)} audio files")
-
-        # Upload files to AWS S3
-        uploaded_files = aws_service.upload_files(audio_files)
-        logger.info(f"Uploaded {len(uploaded_files)} files to AWS S3")
+        # Stream variations, audio files and uploads through one pipeline
+        counts = asyncio.run(run_pipeline(commands, batch_processor, aws_service))
+        logger.info(f"Generated {counts['total_variations']} variations")
+        logger.info(f"Created {counts['total_audio_files']} audio files")
+        logger.info(f"Uploaded {counts['total_uploaded_files']} files to AWS S3")
 
         return {
             "total_commands": len(commands),
-            "total_variations": len(variations),
-            "total_audio_files": len(audio_files),
-            "total_uploaded_files": len(uploaded_files)
+            **counts,
+            "cache_hits": batch_processor.tts_cache.hits
         }
     except Exception as e:
         logger.error(f"Error processing commands: {str(e)}")
         raise
 
+async def run_pipeline(commands: List[Dict[str, Any]], batch_processor: 'BatchProcessor', aws_service: 'AWSService') -> Dict[str, int]:
+    """
+    Runs variation generation, audio creation and upload as overlapping stages.
+
+    Each stage consumes the previous one as an async stream, so GPT, TTS and S3
+    work proceed concurrently and only a bounded window of items is held in
+    memory at any time.
+
+    Args:
+        commands (List[Dict[str, Any]]): Validated input commands.
+        batch_processor (BatchProcessor): Instance of BatchProcessor.
+        aws_service (AWSService): Instance of AWSService.
+
+    Returns:
+        Dict[str, int]: Running totals of variations, audio files and uploaded files.
+    """
+    counts = {"total_variations": 0, "total_audio_files": 0, "total_uploaded_files": 0}
+    variations = count_items(batch_processor.iter_variations(commands), counts, "total_variations")
+    audio_files = count_items(batch_processor.iter_audio_files(variations), counts, "total_audio_files")
+    async for _ in aws_service.iter_upload_files(audio_files, batch_processor.cached_sources):
+        counts["total_uploaded_files"] += 1
+    return counts
+
 @log_decorator(level="INFO")
 def main() -> int:
     """
@@ -119,8 +152,10 @@ def main() -> int:
         # Setup services
         input_processor, batch_processor, aws_service = setup_services(config)
 
-        # Process commands
-        summary = process_commands(input_processor, batch_processor, aws_service, config)
+        # Process commands; worker processes, writer threads and open directory
+        # descriptors are released afterwards
+        with batch_processor, batch_processor.file_manager:
+            summary = process_commands(input_processor, batch_processor, aws_service, config)
 
         # Display summary
         logger.info("Processing complete. Summary:")
@@ -45,9 +45,14 @@ setup(
     include_package_data=True,
     install_requires=read_requirements('requirements.txt'),
     extras_require={
+        'speedups': [
+            'av>=9.2.0',
+            'orjson>=3.6.1',
+        ],
         'dev': [
             'pytest>=6.2.5',
             'pytest-cov>=2.12.1',
+            'pytest-xdist>=2.4.0',
             'mypy>=0.910',
             'black>=21.7b0',
             'isort>=5.9.3',
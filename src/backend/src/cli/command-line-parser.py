@@ -1,39 +1,60 @@
+import os
 import argparse
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from ..config.app_config import APP_CONFIG, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
 from ..utils.logger import logger
 
-CLI_OPTIONS: Dict[str, Dict[str, Any]] = {
-    'apikey': {
+CLI_OPTIONS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ('apikey', {
         'help': 'Narakeet API key',
         'required': True
-    },
-    'language': {
+    }),
+    ('language', {
         'help': f'Target language ({", ".join(SUPPORTED_LANGUAGES)})',
         'choices': SUPPORTED_LANGUAGES,
         'default': DEFAULT_LANGUAGE
-    },
-    'intent_csv': {
+    }),
+    ('intent_csv', {
         'help': 'Path to input CSV file',
         'type': Path,
         'required': True
-    },
-    'outdir': {
+    }),
+    ('outdir', {
         'help': 'Output directory for generated files',
         'type': Path,
         'required': True
-    },
-    'skip_header': {
+    }),
+    ('skip_header', {
         'help': 'Number of header lines to skip',
         'type': int,
         'default': 1
-    }
-}
+    })
+)
 
 DEFAULT_SKIP_HEADER: int = 1
 
+# Accepted input file extensions, lowercase
+_CSV_EXTS: Tuple[str, ...] = ('.csv',)
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Creates and configures the argument parser with all required and optional arguments.
+
+    Returns:
+        argparse.ArgumentParser: Configured argument parser instance.
+    """
+    parser = argparse.ArgumentParser(description="Femtosense Voice Command Generation PoC")
+
+    for option, details in CLI_OPTIONS:
+        parser.add_argument(f'--{option}', **details)
+
+    return parser
+
+# Shared parser, built once at import and reused by every CommandLineParser
+_PARSER: argparse.ArgumentParser = _build_parser()
+
 class CommandLineParser:
     """
     Handles the parsing and validation of command line arguments for the Femtosense Voice Command Generation tool.
@@ -52,21 +73,7 @@ class CommandLineParser:
             config (AppConfig): The application configuration instance.
         """
         self.config = config
-        self.parser = self._create_parser()
-
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """
-        Creates and configures the argument parser with all required and optional arguments.
-
-        Returns:
-            argparse.ArgumentParser: Configured argument parser instance.
-        """
-        parser = argparse.ArgumentParser(description="Femtosense Voice Command Generation PoC")
-        
-        for option, details in CLI_OPTIONS.items():
-            parser.add_argument(f'--{option}', **details)
-
-        return parser
+        self.parser = _PARSER
 
     def parse_arguments(self) -> argparse.Namespace:
         """
@@ -108,7 +115,7 @@ class CommandLineParser:
         """
         if not file_path.is_file():
             raise argparse.ArgumentTypeError(f"Input file does not exist: {file_path}")
-        if not file_path.suffix.lower() == '.csv':
+        if not os.fspath(file_path).lower().endswith(_CSV_EXTS):
             raise argparse.ArgumentTypeError(f"Input file must be a CSV file: {file_path}")
         return file_path
 
@@ -134,7 +141,7 @@ def create_cli_options() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict[str, Dict[str, Any]]: Dictionary of CLI options.
     """
-    return CLI_OPTIONS
+    return dict(CLI_OPTIONS)
 
 def validate_language(language: str) -> str:
     """
@@ -1,28 +1,40 @@
 import sys
-from typing import Dict, Any
+from collections import namedtuple
+from typing import Dict, Any, Tuple
 from tqdm import tqdm
 from colorama import Fore, Style, init
 
 from ..utils.logger import setup_logger
 from ..core.batch_processor import BatchProcessor
 
+# Progress bars and colors are only shown when stdout is an interactive terminal
+_IS_TTY: bool = sys.stdout.isatty()
+
 # Initialize colorama for cross-platform colored output
-init(autoreset=True)
+if _IS_TTY:
+    init(autoreset=True)
+
+# Minimum seconds between progress bar repaints
+PROGRESS_MIN_INTERVAL: float = 0.5
 
 # Define progress stages and color scheme
-PROGRESS_STAGES: Dict[str, str] = {
-    "input_processing": "Processing input file",
-    "variation_generation": "Generating variations",
-    "audio_creation": "Creating audio files",
-    "file_upload": "Uploading files to AWS S3"
-}
-
-COLOR_SCHEME: Dict[str, str] = {
-    "success": Fore.GREEN,
-    "error": Fore.RED,
-    "warning": Fore.YELLOW,
-    "info": Fore.CYAN
-}
+PROGRESS_STAGES: Tuple[Tuple[str, str], ...] = (
+    ("input_processing", "Processing input file"),
+    ("variation_generation", "Generating variations"),
+    ("audio_creation", "Creating audio files"),
+    ("file_upload", "Uploading files to AWS S3")
+)
+
+ColorScheme = namedtuple('ColorScheme', ['success', 'error', 'warning', 'info', 'reset'])
+
+# Color codes per message type; empty when stdout is not a terminal
+COLOR_SCHEME = ColorScheme(
+    success=Fore.GREEN,
+    error=Fore.RED,
+    warning=Fore.YELLOW,
+    info=Fore.CYAN,
+    reset=Style.RESET_ALL
+) if _IS_TTY else ColorScheme('', '', '', '', '')
 
 class ProgressDisplay:
     """
@@ -45,13 +57,14 @@ class ProgressDisplay:
     - Error Reporting (Technical Specification/3.6 Component Details)
     """
 
-    def __init__(self, total_steps: int, disable_progress_bar: bool = False):
+    def __init__(self, total_steps: int, disable_progress_bar: bool = not _IS_TTY):
         """
         Initializes the ProgressDisplay with total steps and progress bar settings.
 
         Args:
             total_steps (int): Total number of steps in the batch process.
             disable_progress_bar (bool): Flag to disable progress bar display.
+                Defaults to disabled when stdout is not a terminal.
         """
         self.total_steps = total_steps
         self.current_step = 0
@@ -60,15 +73,29 @@ class ProgressDisplay:
         self.logger = setup_logger(__name__)
 
         # Initialize progress bars for each stage
-        for stage, description in PROGRESS_STAGES.items():
+        for stage, description in PROGRESS_STAGES:
             self.progress_bars[stage] = tqdm(
                 total=100,
                 desc=description,
                 disable=self.disable_progress_bar,
                 file=sys.stdout,
+                mininterval=PROGRESS_MIN_INTERVAL,
                 bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}"
             )
 
+    def set_total(self, step_name: str, total: int):
+        """
+        Sets the number of units a processing step is expected to complete.
+
+        Args:
+            step_name (str): Name of the step being updated.
+            total (int): Total number of units for the step.
+        """
+        if step_name in self.progress_bars:
+            self.progress_bars[step_name].reset(total=total)
+        else:
+            self.logger.warning(f"Unknown step name: {step_name}")
+
     def update_progress(self, step_name: str, increment: int, status: str = ""):
         """
         Updates the progress for a specific processing step.
@@ -84,8 +111,8 @@ class ProgressDisplay:
         if step_name in self.progress_bars:
             self.progress_bars[step_name].update(increment)
             if status:
-                self.progress_bars[step_name].set_postfix_str(status)
-            self.logger.info(f"Progress update: {step_name} - {increment}% - {status}")
+                self.progress_bars[step_name].set_postfix_str(status, refresh=False)
+            self.logger.debug("Progress update: %s +%s %s", step_name, increment, status)
         else:
             self.logger.warning(f"Unknown step name: {step_name}")
 
@@ -100,7 +127,7 @@ class ProgressDisplay:
         Requirements addressed:
         - Error Reporting (Technical Specification/3.6 Component Details)
         """
-        formatted_error = f"{COLOR_SCHEME['error']}Error: {error_message}{Style.RESET_ALL}"
+        formatted_error = f"{COLOR_SCHEME.error}Error: {error_message}{COLOR_SCHEME.reset}"
         print(formatted_error, file=sys.stderr)
         
         if step_name in self.progress_bars:
@@ -202,25 +229,30 @@ def display_batch_progress(batch_processor: BatchProcessor, input_file: str, ski
         total_commands = len(commands)
         logger.info(f"Total commands to process: {total_commands}")
 
-        for i, command in enumerate(commands, 1):
+        for step_name in ("variation_generation", "audio_creation", "file_upload"):
+            progress_display.set_total(step_name, total_commands)
+
+        successful_variations = 0
+        successful_audio_files = 0
+        for command in commands:
             # Generate variations
-            progress_display.update_progress("variation_generation", 0, f"Command {i}/{total_commands}")
             variations = batch_processor.generate_variations(command)
-            progress_display.update_progress("variation_generation", (i / total_commands) * 100, f"Generated {len(variations)} variations")
+            successful_variations += len(variations)
+            progress_display.update_progress("variation_generation", 1)
 
             # Create audio files
-            progress_display.update_progress("audio_creation", 0, f"Command {i}/{total_commands}")
             audio_files = batch_processor.create_audio_files(variations, command)
-            progress_display.update_progress("audio_creation", (i / total_commands) * 100, f"Created {len(audio_files)} audio files")
+            successful_audio_files += len(audio_files)
+            progress_display.update_progress("audio_creation", 1)
 
             # Upload files (assuming this is part of create_audio_files)
-            progress_display.update_progress("file_upload", (i / total_commands) * 100, f"Uploaded files for command {i}")
+            progress_display.update_progress("file_upload", 1)
 
         # Display summary
         results = {
             "total_commands": total_commands,
-            "successful_variations": sum(len(batch_processor.generate_variations(cmd)) for cmd in commands),
-            "successful_audio_files": sum(len(batch_processor.create_audio_files(batch_processor.generate_variations(cmd), cmd)) for cmd in commands),
+            "successful_variations": successful_variations,
+            "successful_audio_files": successful_audio_files,
             "errors": []  # Actual errors would be collected during processing
         }
         progress_display.display_summary(results)
@@ -1,5 +1,6 @@
 import os
-from typing import Dict, List, Any
+import itertools
+from typing import Dict, Iterator, Any, Tuple
 
 # Internal imports
 from .logging_config import configure_logging
@@ -42,22 +43,30 @@ AWS_CONFIG = {
 }
 
 # Voice Registry
-VOICE_REGISTRY: Dict[str, List[str]] = {
-    'korean': ['Chae-Won', 'Min-Ho', 'Seo-Yeon', 'Tae-Hee', 'Joon-Gi'],
-    'english': ['Matt', 'Linda', 'Betty'],
-    'japanese': ['Yuriko', 'Akira', 'Kasumi']
+VOICE_REGISTRY: Dict[str, Tuple[str, ...]] = {
+    'korean': ('Chae-Won', 'Min-Ho', 'Seo-Yeon', 'Tae-Hee', 'Joon-Gi'),
+    'english': ('Matt', 'Linda', 'Betty'),
+    'japanese': ('Yuriko', 'Akira', 'Kasumi')
 }
 
 class AppConfig:
     """
     Configuration class for the Femtosense Voice Command Generation application.
     Handles loading and providing access to all configuration settings.
+
+    Attributes are declared in __slots__ so lookups on hot paths skip the
+    instance dictionary, and the per-language voice rotation is precomputed.
     """
 
+    __slots__ = ('api_keys', 'aws_config', 'voice_registry', 'voice_cycle')
+
     def __init__(self):
         self.api_keys: Dict[str, str] = {}
         self.aws_config: Dict[str, Any] = AWS_CONFIG
-        self.voice_registry: Dict[str, List[str]] = VOICE_REGISTRY
+        self.voice_registry: Dict[str, Tuple[str, ...]] = VOICE_REGISTRY
+        self.voice_cycle: Dict[str, Iterator[str]] = {
+            language: itertools.cycle(voices) for language, voices in VOICE_REGISTRY.items()
+        }
 
     def load_config(self) -> None:
         """
@@ -74,8 +83,9 @@ class AppConfig:
         """
         Loads API keys from environment variables.
         """
-        self.api_keys['gpt'] = os.environ.get('GPT_API_KEY', '')
-        self.api_keys['narakeet'] = os.environ.get('NARAKEET_API_KEY', '')
+        env = os.environ
+        self.api_keys['gpt'] = env.get('GPT_API_KEY', '')
+        self.api_keys['narakeet'] = env.get('NARAKEET_API_KEY', '')
 
         if not all(self.api_keys.values()):
             raise ValueError("Missing API keys. Please set GPT_API_KEY and NARAKEET_API_KEY environment variables.")
@@ -87,8 +97,9 @@ class AppConfig:
         This method addresses the 'AWS Configuration' requirement
         from Technical Specification/5.2 CLOUD SERVICES.
         """
-        aws_access_key = os.environ.get('AWS_ACCESS_KEY_ID')
-        aws_secret_key = os.environ.get('AWS_SECRET_ACCESS_KEY')
+        env = os.environ
+        aws_access_key = env.get('AWS_ACCESS_KEY_ID')
+        aws_secret_key = env.get('AWS_SECRET_ACCESS_KEY')
 
         if not aws_access_key or not aws_secret_key:
             raise ValueError("Missing AWS credentials. Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables.")
@@ -115,22 +126,48 @@ class AppConfig:
             raise ValueError(f"Unknown service: {service}. Valid options are 'gpt' and 'narakeet'.")
         return self.api_keys[service]
 
+    def next_voice(self, language: str) -> str:
+        """
+        Returns the next voice for a language in round-robin order.
+
+        Args:
+            language (str): The language to pick a voice for.
+
+        Returns:
+            str: The selected voice name.
+
+        Raises:
+            ValueError: If the specified language has no registered voices.
+        """
+        if language not in self.voice_cycle:
+            raise ValueError(f"Unknown language: {language}. Valid options are {', '.join(self.voice_cycle)}.")
+        return next(self.voice_cycle[language])
+
 # Global instance of AppConfig
 APP_CONFIG = AppConfig()
 
+# Set once APP_CONFIG has been loaded; forked worker processes inherit it
+_APP_CONFIG_INITIALIZED: bool = False
+
 def initialize_app_config():
     """
     Initializes the global APP_CONFIG instance.
     This function should be called at the start of the application.
+    Subsequent calls are no-ops.
     """
+    global _APP_CONFIG_INITIALIZED
+    if _APP_CONFIG_INITIALIZED:
+        return
     APP_CONFIG.load_config()
+    _APP_CONFIG_INITIALIZED = True
 
 # Ensure all required environment variables are set
 required_env_vars = [
     'GPT_API_KEY', 'NARAKEET_API_KEY', 'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY'
 ]
 
-missing_vars = [var for var in required_env_vars if var not in os.environ]
+_env = os.environ
+missing_vars = [var for var in required_env_vars if var not in _env]
 if missing_vars:
     raise EnvironmentError(f"Missing required environment variables: {', '.join(missing_vars)}")
 
@@ -1,6 +1,9 @@
 import os
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import logging.config
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Dict, Any, List
 from ..utils.error_handler import ValidationError
 
@@ -16,6 +19,37 @@ DEFAULT_LOG_LEVEL: str = 'INFO'
 LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_DATE_FORMAT: str = '%Y-%m-%d %H:%M:%S'
 LOG_FILE_PATH: str = os.path.join(os.path.dirname(__file__), '..', '..', 'logs', 'femtosense_voice_command.log')
+LOG_MAX_BYTES: int = 10485760  # 10MB
+LOG_BACKUP_COUNT: int = 5
+
+# Static part of the dictConfig schema, built once; only the levels vary per setup
+_BASE_LOG_CONFIG: Dict[str, Any] = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'default': {
+            'format': LOG_FORMAT,
+            'datefmt': LOG_DATE_FORMAT
+        }
+    },
+    'handlers': {
+        'file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'formatter': 'default',
+            'filename': LOG_FILE_PATH,
+            'maxBytes': LOG_MAX_BYTES,
+            'backupCount': LOG_BACKUP_COUNT
+        },
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'default',
+            'stream': 'ext://sys.stdout'
+        }
+    }
+}
+
+# Set once setup_logging has applied a configuration
+_CONFIGURED: bool = False
 
 class LogConfig:
     """
@@ -36,44 +70,25 @@ class LogConfig:
         """
         self.log_level = log_level or DEFAULT_LOG_LEVEL
         self.handlers: List[logging.Handler] = []
-        self.formatters: Dict[str, logging.Formatter] = {}
+        self.formatters: Dict[str, logging.Formatter] = {
+            'default': logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+        }
 
     def configure_logging(self) -> Dict[str, Any]:
         """
         Generates a logging configuration dictionary for use with logging.config.dictConfig.
 
+        Handlers are not instantiated here; dictConfig builds them from the
+        returned dictionary.
+
         Returns:
             Dict[str, Any]: Logging configuration dictionary.
         """
-        self.handlers = [self.get_file_handler(), self.get_console_handler()]
-        self.formatters = {
-            'default': logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
-        }
-
         return {
-            'version': 1,
-            'disable_existing_loggers': False,
-            'formatters': {
-                'default': {
-                    'format': LOG_FORMAT,
-                    'datefmt': LOG_DATE_FORMAT
-                }
-            },
+            **_BASE_LOG_CONFIG,
             'handlers': {
-                'file': {
-                    'class': 'logging.handlers.RotatingFileHandler',
-                    'level': self.log_level,
-                    'formatter': 'default',
-                    'filename': LOG_FILE_PATH,
-                    'maxBytes': 10485760,  # 10MB
-                    'backupCount': 5
-                },
-                'console': {
-                    'class': 'logging.StreamHandler',
-                    'level': self.log_level,
-                    'formatter': 'default',
-                    'stream': 'ext://sys.stdout'
-                }
+                name: {**handler, 'level': self.log_level}
+                for name, handler in _BASE_LOG_CONFIG['handlers'].items()
             },
             'root': {
                 'level': self.log_level,
@@ -91,8 +106,8 @@ class LogConfig:
         os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
         file_handler = RotatingFileHandler(
             LOG_FILE_PATH,
-            maxBytes=10485760,  # 10MB
-            backupCount=5
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT
         )
         file_handler.setLevel(self.log_level)
         file_handler.setFormatter(self.formatters['default'])
@@ -128,10 +143,47 @@ def get_log_level(level_name: str) -> int:
         raise ValidationError(f"Invalid log level: {level_name}. Valid levels are: {', '.join(LOG_LEVELS.keys())}")
     return level
 
+def start_queue_listener(*handlers: logging.Handler) -> QueueHandler:
+    """
+    Runs handlers on a background thread fed through a queue.
+
+    The returned QueueHandler only enqueues records; formatting, file writes
+    and rotation happen on the listener thread. The listener is flushed and
+    stopped at interpreter exit.
+
+    Args:
+        *handlers (logging.Handler): Handlers serviced by the listener.
+
+    Returns:
+        QueueHandler: Handler that hands records to the listener.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return QueueHandler(log_queue)
+
+def _start_queue_listener() -> None:
+    """
+    Moves the root logger's handlers behind a queue serviced by a background thread.
+
+    Logging calls then only enqueue the record; see start_queue_listener.
+    """
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(start_queue_listener(*handlers))
+
 def setup_logging(log_level: str) -> None:
     """
     Initializes logging for the entire application using the specified configuration.
 
+    Only the first call applies a configuration; later calls return immediately.
+    Records are handed to the file and console handlers through a queue, so
+    logging threads never block on handler I/O.
+
     Requirements addressed:
     - Logging Standards (Technical Specification/3. SYSTEM ARCHITECTURE/3.6 Component Details)
     - Security Monitoring (Technical Specification/6. SECURITY CONSIDERATIONS/6.3.1 Operational Security)
@@ -142,18 +194,22 @@ def setup_logging(log_level: str) -> None:
 
     Returns:
         None
+
+    Raises:
+        ValidationError: If the provided log level is invalid.
     """
-    try:
-        numeric_level = get_log_level(log_level)
-        log_config = LogConfig(numeric_level)
-        config_dict = log_config.configure_logging()
-        logging.config.dictConfig(config_dict)
-        logging.info(f"Logging initialized with level: {log_level}")
-    except Exception as e:
-        # If there's an error setting up logging, we'll use a basic configuration
-        # and log the error to stderr
-        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-        logging.error(f"Error setting up logging: {str(e)}")
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+
+    # Validate first: an unknown level is the only expected configuration error
+    numeric_level = get_log_level(log_level)
+    config_dict = LogConfig(numeric_level).configure_logging()
+    os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
+    logging.config.dictConfig(config_dict)
+    _start_queue_listener()
+    _CONFIGURED = True
+    logging.info(f"Logging initialized with level: {log_level}")
 
 # Environment-specific configuration
 ENVIRONMENT: str = os.getenv('ENVIRONMENT', 'development')
\ No newline at end of file
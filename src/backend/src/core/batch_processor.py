@@ -1,12 +1,30 @@
+import os
+import sys
+import asyncio
+import functools
 import concurrent.futures
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, AsyncIterator, Callable, Iterable, List, Optional, Tuple, TypeVar
 from tqdm import tqdm
 
 from ..core.input_processor import InputProcessor
 from ..core.file_manager import FileManager
-from ..utils.audio_converter import convert_audio
+from ..core.tts_cache import TTSCache
+from ..utils.async_pipeline import map_unordered
+from ..utils.audio_converter import convert_audio_buffer
+from ..utils.error_handler import ApiRequestError
 from ..utils.logger import setup_logger
-from ..config.app_config import AppConfig
+from ..config.app_config import AppConfig, API_CONFIG
+
+# Maximum number of in-flight Narakeet TTS requests (provider rate cap)
+TTS_MAX_CONCURRENCY: int = 8
+# Base delay in seconds for exponential backoff on rate-limited TTS requests
+TTS_BACKOFF_BASE: float = 1.0
+
+# Progress bar repaint limits: minimum seconds between repaints and maximum repaints per batch
+PROGRESS_MIN_INTERVAL: float = 0.5
+PROGRESS_MAX_REFRESHES: int = 200
+
+T = TypeVar('T')
 
 class BatchProcessor:
     """
@@ -19,6 +37,11 @@ class BatchProcessor:
         config (AppConfig): Application configuration instance.
         input_processor (InputProcessor): Instance for processing input data.
         file_manager (FileManager): Instance for managing file operations.
+        tts_cache (TTSCache): Cache of synthesized audio keyed by language, voice and phrase.
+        cached_sources (Dict[str, str]): S3 keys of cached objects identical to the
+            audio file saved under each destination S3 key.
+        cpu_pool (Optional[concurrent.futures.Executor]): Process pool running CPU-bound
+            audio conversion; created on first use and shut down by close().
         logger: Logger instance for tracking batch processing operations.
         batch_size (int): Number of items to process in each batch.
         max_workers (int): Maximum number of concurrent workers for parallel processing.
@@ -36,16 +59,48 @@ class BatchProcessor:
         self.config = config
         self.input_processor = input_processor
         self.file_manager = file_manager
+        self.tts_cache = TTSCache(
+            s3_client=getattr(file_manager, 's3_client', None),
+            bucket_name=getattr(file_manager, 'bucket_name', None)
+        )
+        self.cached_sources: Dict[str, str] = {}
+        self.cpu_pool: Optional[concurrent.futures.Executor] = None
         self.logger = setup_logger(__name__)
         self.batch_size = config.get_batch_size()
         self.max_workers = config.get_max_workers()
 
+    def __enter__(self) -> 'BatchProcessor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the audio conversion process pool, if one was started.
+        """
+        if self.cpu_pool is not None:
+            self.cpu_pool.shutdown(wait=True)
+            self.cpu_pool = None
+
+    def _get_cpu_pool(self) -> concurrent.futures.Executor:
+        """
+        Returns the process pool for audio conversion, starting it on first use.
+
+        Returns:
+            concurrent.futures.Executor: Executor running CPU-bound conversions.
+        """
+        if self.cpu_pool is None:
+            self.cpu_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self.cpu_pool
+
     def process_batch(self, input_file: str, skip_header: int = 0) -> Dict[str, Any]:
         """
         Processes a batch of voice commands from an input file.
 
         This method orchestrates the entire batch processing workflow, including
         input validation, variation generation, audio creation, and storage management.
+        Commands are processed concurrently on an asyncio event loop.
 
         Args:
             input_file (str): Path to the input file containing voice commands.
@@ -57,7 +112,7 @@ class BatchProcessor:
         Raises:
             ValueError: If the input file is invalid or cannot be processed.
         """
-        self.logger.info(f"Starting batch processing for file: {input_file}")
+        self.logger.info("Starting batch processing for file: %s", input_file)
 
         # Validate input file
         if not self.file_manager.validate_file(input_file):
@@ -65,37 +120,70 @@ class BatchProcessor:
 
         # Process input file
         commands = self.input_processor.process_file(input_file, skip_header)
-        self.logger.info(f"Processed {len(commands)} commands from input file")
+        self.logger.info("Processed %d commands from input file", len(commands))
+
+        return asyncio.run(self._process_commands(commands))
+
+    async def _process_commands(self, commands: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Processes commands concurrently on the event loop.
+
+        At most max_workers commands are in flight at once, and all of them share
+        one TTS semaphore so the provider rate cap holds across the whole batch.
+
+        Args:
+            commands (List[Dict[str, str]]): Validated commands to process.
 
+        Returns:
+            Dict[str, Any]: Batch processing results including statistics and any errors.
+        """
         results = {
             "total_commands": len(commands),
             "successful_variations": 0,
             "successful_audio_files": 0,
             "errors": []
         }
+        command_semaphore = asyncio.Semaphore(self.max_workers)
+        tts_semaphore = asyncio.Semaphore(TTS_MAX_CONCURRENCY)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_command = {executor.submit(self._process_command, command): command for command in commands}
-            
-            for future in tqdm(concurrent.futures.as_completed(future_to_command), total=len(commands), desc="Processing commands"):
-                command = future_to_command[future]
+        async def run(command: Dict[str, str]) -> Tuple[Dict[str, str], Any, Optional[Exception]]:
+            async with command_semaphore:
                 try:
-                    variations, audio_files = future.result()
-                    results["successful_variations"] += len(variations)
-                    results["successful_audio_files"] += len(audio_files)
+                    return command, await self._process_command(command, tts_semaphore), None
                 except Exception as e:
-                    self.logger.error(f"Error processing command: {command}. Error: {str(e)}")
-                    results["errors"].append({"command": command, "error": str(e)})
+                    return command, None, e
+
+        tasks = [run(command) for command in commands]
+        progress = tqdm(
+            asyncio.as_completed(tasks),
+            total=len(commands),
+            desc="Processing commands",
+            mininterval=PROGRESS_MIN_INTERVAL,
+            miniters=max(1, len(commands) // PROGRESS_MAX_REFRESHES),
+            smoothing=0,
+            disable=not sys.stderr.isatty()
+        )
+        for next_result in progress:
+            command, outcome, error = await next_result
+            if error is not None:
+                self.logger.error("Error processing command: %s", command, exc_info=error)
+                results["errors"].append({"command": command, "error": str(error)})
+                continue
+            variations, audio_files = outcome
+            results["successful_variations"] += len(variations)
+            results["successful_audio_files"] += len(audio_files)
 
         self.logger.info("Batch processing completed")
         return results
 
-    def _process_command(self, command: Dict[str, str]) -> Tuple[List[str], List[Tuple[str, str]]]:
+    async def _process_command(self, command: Dict[str, str],
+                               semaphore: Optional[asyncio.Semaphore] = None) -> Tuple[List[str], List[Tuple[str, str]]]:
         """
         Processes a single command by generating variations and creating audio files.
 
         Args:
             command (Dict[str, str]): A dictionary containing command details.
+            semaphore (Optional[asyncio.Semaphore]): Semaphore bounding concurrent TTS requests.
 
         Returns:
             Tuple[List[str], List[Tuple[str, str]]]: A tuple containing the list of
@@ -105,8 +193,9 @@ class BatchProcessor:
         Raises:
             Exception: If there's an error in variation generation or audio creation.
         """
-        variations = self.generate_variations(command)
-        audio_files = self.create_audio_files(variations, command)
+        loop = asyncio.get_running_loop()
+        variations = await loop.run_in_executor(None, self.generate_variations, command)
+        audio_files = await self.create_audio_files_async(variations, command, semaphore)
         return variations, audio_files
 
     def generate_variations(self, command: Dict[str, str]) -> List[str]:
@@ -125,7 +214,7 @@ class BatchProcessor:
         Raises:
             Exception: If there's an error in the variation generation process.
         """
-        self.logger.info(f"Generating variations for command: {command['phrase']}")
+        self.logger.info("Generating variations for command: %s", command['phrase'])
         
         try:
             # Extract phrase from command
@@ -139,19 +228,18 @@ class BatchProcessor:
             # Validate generated variations
             valid_variations = self._validate_variations(raw_variations, command['intent'])
             
-            self.logger.info(f"Generated {len(valid_variations)} valid variations")
+            self.logger.info("Generated %d valid variations", len(valid_variations))
             return valid_variations
         except Exception as e:
-            self.logger.error(f"Error generating variations: {str(e)}")
+            self.logger.error("Error generating variations: %s", e, exc_info=True)
             raise
 
     def create_audio_files(self, variations: List[str], metadata: Dict[str, str]) -> List[Tuple[str, str]]:
         """
         Creates audio files for a list of variations.
 
-        This method generates audio for each variation using the TTS service,
-        converts the audio to the required format, and saves the files using
-        the file manager.
+        Synchronous entry point kept for existing callers; the work is delegated
+        to create_audio_files_async so TTS requests run concurrently.
 
         Args:
             variations (List[str]): List of text variations to convert to audio.
@@ -160,37 +248,226 @@ class BatchProcessor:
         Returns:
             List[Tuple[str, str]]: A list of tuples containing local and S3 paths
             for the generated audio files.
+        """
+        return asyncio.run(self.create_audio_files_async(variations, metadata))
+
+    async def create_audio_files_async(self, variations: List[str], metadata: Dict[str, str],
+                                       semaphore: Optional[asyncio.Semaphore] = None,
+                                       upload: bool = True) -> List[Tuple[str, str]]:
+        """
+        Creates audio files for a list of variations concurrently.
+
+        Variations missing from the TTS cache are synthesized with one batched
+        TTS request per voice, converted to the required format and saved
+        through the file manager. At most TTS_MAX_CONCURRENCY TTS requests are in
+        flight at any time; failed variations are logged and skipped.
+
+        Args:
+            variations (List[str]): List of text variations to convert to audio.
+            metadata (Dict[str, str]): Metadata for the original command.
+            semaphore (Optional[asyncio.Semaphore]): Semaphore bounding concurrent TTS
+                requests; a new one is created when not given.
+            upload (bool): Whether the file manager uploads the files to S3; when
+                False only local copies are written, for a later upload stage.
+
+        Returns:
+            List[Tuple[str, str]]: A list of tuples containing local and S3 paths
+            for the generated audio files, in the order of the input variations.
+        """
+        self.logger.info("Creating audio files for %d variations", len(variations))
+
+        loop = asyncio.get_running_loop()
+        semaphore = semaphore or asyncio.Semaphore(TTS_MAX_CONCURRENCY)
+        language = metadata['language']
+        voices = [metadata.get('voice_id') or self.config.next_voice(language) for _ in variations]
+        cache_keys = [TTSCache.make_key(language, voice, variation) for voice, variation in zip(voices, variations)]
+        cached_audio = await asyncio.gather(
+            *(loop.run_in_executor(None, self.tts_cache.get, cache_key) for cache_key in cache_keys)
+        )
+
+        # Cache misses that share a voice are synthesized with one batched TTS request
+        misses: Dict[str, List[int]] = {}
+        for index, audio in enumerate(cached_audio):
+            if audio is None:
+                misses.setdefault(voices[index], []).append(index)
+        batches = await asyncio.gather(*(
+            self._synthesize_batch([variations[i] for i in indexes], [cache_keys[i] for i in indexes],
+                                   language, voice, semaphore)
+            for voice, indexes in misses.items()
+        ))
+        synthesized: Dict[int, Optional[bytes]] = {}
+        for indexes, batch in zip(misses.values(), batches):
+            synthesized.update(zip(indexes, batch))
+
+        results = await asyncio.gather(*(
+            self._save_audio_file(variation, metadata, voice, cache_key,
+                                  audio if audio is not None else synthesized[index],
+                                  cache_hit=audio is not None, upload=upload)
+            for index, (variation, voice, cache_key, audio)
+            in enumerate(zip(variations, voices, cache_keys, cached_audio))
+        ))
+        audio_files = [result for result in results if result is not None]
+
+        self.logger.info("Created %d audio files", len(audio_files))
+        return audio_files
+
+    async def iter_variations(self, commands: Iterable[Dict[str, str]]) -> AsyncIterator[Tuple[str, Dict[str, str]]]:
+        """
+        Streams the variations of each command as they are generated.
+
+        Args:
+            commands (Iterable[Dict[str, str]]): Commands to generate variations for.
+
+        Yields:
+            Tuple[str, Dict[str, str]]: A variation together with its command metadata.
+        """
+        loop = asyncio.get_running_loop()
+        for command in commands:
+            variations = await loop.run_in_executor(None, self.generate_variations, command)
+            for variation in variations:
+                yield variation, command
+
+    async def iter_audio_files(self, variations: AsyncIterator[Tuple[str, Dict[str, str]]]) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Streams audio files for a stream of variations.
+
+        Consecutive variations of the same command are grouped and passed to
+        create_audio_files_async, so they share the TTS cache lookups and one
+        batched TTS request per voice. Groups are pulled from the upstream stage
+        only while fewer than DEFAULT_STAGE_WINDOW of them are being processed,
+        so generation, synthesis and downstream uploads overlap without
+        buffering whole batches. Files are only written locally; uploading them
+        is left to the downstream stage, so each file is sent to S3 once.
+
+        Args:
+            variations (AsyncIterator[Tuple[str, Dict[str, str]]]): Variations with their command metadata.
+
+        Yields:
+            Tuple[str, str]: Local and S3 paths of each created audio file.
+        """
+        semaphore = asyncio.Semaphore(TTS_MAX_CONCURRENCY)
+
+        async def create(group: Tuple[List[str], Dict[str, str]]) -> List[Tuple[str, str]]:
+            texts, metadata = group
+            return await self.create_audio_files_async(texts, metadata, semaphore, upload=False)
+
+        async for audio_files in map_unordered(create, _group_by_command(variations)):
+            for audio_file in audio_files:
+                yield audio_file
+
+    async def _synthesize_batch(self, texts: List[str], cache_keys: List[str], language: str,
+                                voice: str, semaphore: asyncio.Semaphore) -> List[Optional[bytes]]:
+        """
+        Synthesizes several texts with one TTS request and converts the results.
+
+        Converted audio is stored in the TTS cache under the matching key.
+
+        Args:
+            texts (List[str]): The texts to convert to audio.
+            cache_keys (List[str]): TTS cache keys of the texts.
+            language (str): The language of the texts.
+            voice (str): The voice to synthesize with.
+            semaphore (asyncio.Semaphore): Semaphore bounding concurrent TTS requests.
+
+        Returns:
+            List[Optional[bytes]]: Converted audio per text, or None where synthesis
+            or conversion failed.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            async with semaphore:
+                batch = await self._call_tts_with_retry(self._generate_audio_batch, texts, language, voice,
+                                                        timeout_scale=len(texts))
+        except Exception:
+            self.logger.error("Error synthesizing %d variations with voice %s", len(texts), voice, exc_info=True)
+            return [None] * len(texts)
+
+        async def convert(text: str, cache_key: str, audio_data: bytes) -> Optional[bytes]:
+            try:
+                converted_audio = await loop.run_in_executor(self._get_cpu_pool(), convert_audio_buffer, audio_data, 'wav')
+                await loop.run_in_executor(None, self.tts_cache.put, cache_key, converted_audio)
+                return converted_audio
+            except Exception:
+                self.logger.error("Error converting audio for variation '%s'", text, exc_info=True)
+                return None
+
+        return list(await asyncio.gather(*(convert(*item) for item in zip(texts, cache_keys, batch))))
+
+    async def _save_audio_file(self, variation: str, metadata: Dict[str, str], voice: str, cache_key: str,
+                               converted_audio: Optional[bytes], cache_hit: bool,
+                               upload: bool = True) -> Optional[Tuple[str, str]]:
+        """
+        Saves converted audio for a variation through the file manager.
+
+        Args:
+            variation (str): The text variation the audio was synthesized from.
+            metadata (Dict[str, str]): Metadata for the original command.
+            voice (str): The voice the audio was synthesized with.
+            cache_key (str): TTS cache key of the variation.
+            converted_audio (Optional[bytes]): Converted audio, or None if it could not be produced.
+            cache_hit (bool): Whether the audio was served from the TTS cache.
+            upload (bool): Whether the file manager uploads the file to S3. Cache hits
+                are then copied from the cached object server-side; otherwise the
+                cached object is recorded in cached_sources for the upload stage.
+
+        Returns:
+            Optional[Tuple[str, str]]: Local and S3 paths of the saved file, or None
+            if there is no audio or it could not be saved.
+        """
+        if converted_audio is None:
+            return None
+
+        copy_source = TTSCache.s3_key(cache_key) if cache_hit else None
+        file_metadata = {
+            'language': metadata['language'],
+            'intent': metadata['intent'],
+            'variation': variation,
+            'voice_id': voice
+        }
+        loop = asyncio.get_running_loop()
+        try:
+            audio_file = await loop.run_in_executor(
+                None, functools.partial(self.file_manager.save_audio_file, converted_audio, file_metadata,
+                                        upload=upload, copy_source=copy_source)
+            )
+        except Exception:
+            self.logger.error("Error saving audio for variation '%s'", variation, exc_info=True)
+            return None
+
+        if copy_source and not upload and audio_file:
+            self.cached_sources[audio_file[1]] = copy_source
+        return audio_file
+
+    async def _call_tts_with_retry(self, func: Callable[..., T], *args: Any, timeout_scale: int = 1) -> T:
+        """
+        Runs a blocking TTS call in the executor with a timeout, retrying rate-limited requests.
+
+        Args:
+            func (Callable[..., T]): The blocking TTS call.
+            *args (Any): Arguments for func.
+            timeout_scale (int): Multiplier for the per-request timeout, for calls
+                that cover several texts.
+
+        Returns:
+            T: The result of func.
 
         Raises:
-            Exception: If there's an error in audio generation or file saving.
+            ApiRequestError: If the request is still rate limited after all retries.
+            asyncio.TimeoutError: If the TTS service does not answer in time.
         """
-        self.logger.info(f"Creating audio files for {len(variations)} variations")
-        
-        audio_files = []
-        for variation in variations:
+        loop = asyncio.get_running_loop()
+        timeout = API_CONFIG['narakeet']['timeout'] * timeout_scale
+        max_retries = API_CONFIG['narakeet']['max_retries']
+
+        for attempt in range(max_retries + 1):
             try:
-                # Generate audio for the variation
-                # Note: This is a placeholder. Actual implementation would involve
-                # making an API call to the TTS service.
-                audio_data = self._generate_audio(variation, metadata['language'])
-                
-                # Convert audio to required format
-                converted_audio = convert_audio(audio_data, 'wav')
-                
-                # Save audio file using file manager
-                local_path, s3_path = self.file_manager.save_audio_file(
-                    converted_audio,
-                    metadata['intent'],
-                    variation,
-                    metadata['language']
-                )
-                
-                audio_files.append((local_path, s3_path))
-            except Exception as e:
-                self.logger.error(f"Error creating audio for variation '{variation}': {str(e)}")
-        
-        self.logger.info(f"Created {len(audio_files)} audio files")
-        return audio_files
+                return await asyncio.wait_for(loop.run_in_executor(None, func, *args), timeout)
+            except ApiRequestError as e:
+                if e.error_code != 429 or attempt == max_retries:
+                    raise
+                delay = float(e.details.get('retry_after') or TTS_BACKOFF_BASE * 2 ** attempt)
+                self.logger.warning("TTS request rate limited, retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
 
     def _call_gpt_api(self, phrase: str) -> List[str]:
         """
@@ -225,13 +502,14 @@ class BatchProcessor:
         # Placeholder implementation
         return [v for v in variations if intent.lower() in v.lower()]
 
-    def _generate_audio(self, text: str, language: str) -> bytes:
+    def _generate_audio(self, text: str, language: str, voice: Optional[str] = None) -> bytes:
         """
         Generates audio for the given text using the TTS service.
 
         Args:
             text (str): The text to convert to audio.
             language (str): The language of the text.
+            voice (Optional[str]): The voice to synthesize with.
 
         Returns:
             bytes: Raw audio data.
@@ -242,6 +520,49 @@ class BatchProcessor:
         # Placeholder implementation
         return b'audio_data_placeholder'
 
+    def _generate_audio_batch(self, texts: List[str], language: str, voice: Optional[str] = None) -> List[bytes]:
+        """
+        Generates audio for several texts with a single TTS request.
+
+        Args:
+            texts (List[str]): The texts to convert to audio.
+            language (str): The language of the texts.
+            voice (Optional[str]): The voice to synthesize with.
+
+        Returns:
+            List[bytes]: Raw audio data per text, in input order.
+
+        Note: This is a placeholder method. Actual implementation would send all
+        texts in one request to the TTS service's batch endpoint; until then it
+        falls back to one _generate_audio call per text.
+        """
+        # Placeholder implementation
+        return [self._generate_audio(text, language, voice) for text in texts]
+
+async def _group_by_command(variations: AsyncIterator[Tuple[str, Dict[str, str]]]) -> AsyncIterator[Tuple[List[str], Dict[str, str]]]:
+    """
+    Groups consecutive variations that belong to the same command.
+
+    iter_variations yields all variations of a command together, sharing the
+    command's metadata dictionary, so a group ends when the metadata changes.
+
+    Args:
+        variations (AsyncIterator[Tuple[str, Dict[str, str]]]): Variations with their command metadata.
+
+    Yields:
+        Tuple[List[str], Dict[str, str]]: The variations of one command and its metadata.
+    """
+    texts: List[str] = []
+    current: Optional[Dict[str, str]] = None
+    async for variation, metadata in variations:
+        if metadata is not current and texts:
+            yield texts, current
+            texts = []
+        current = metadata
+        texts.append(variation)
+    if texts:
+        yield texts, current
+
 def create_batch_report(results: Dict[str, Any]) -> str:
     """
     Creates a detailed report of the batch processing results.
@@ -1,14 +1,41 @@
+import io
 import os
+import mmap
+import functools
+import contextlib
+import threading
+import concurrent.futures
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Tuple, List
-import boto3
+from typing import Dict, Any, Iterator, Tuple, List, Optional, Set
 from ..utils.logger import logger
+from ..utils.s3_client import get_s3_client
 from ..config.app_config import AppConfig
-from ..utils.audio_converter import convert_to_wav
 
 # Global configuration for the FileManager
 FILE_MANAGER_CONFIG: Dict[str, Any] = {}
 
+# Settings for the transfer manager shared by all S3 uploads; files above the
+# threshold are sent as concurrent parts of the same size
+S3_TRANSFER_SETTINGS: Dict[str, Any] = {
+    'max_concurrency': 32,
+    'use_threads': True,
+    'multipart_threshold': 8 * 1024 * 1024,
+    'multipart_chunksize': 8 * 1024 * 1024
+}
+
+# Number of background threads persisting local copies of uploaded audio
+LOCAL_WRITER_WORKERS: int = 4
+
+# Number of output directories kept open for relative file creation
+DIR_FD_CACHE_SIZE: int = 64
+
+# Flags for creating or overwriting an output audio file
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+# Whether os.open can resolve file names relative to an open directory
+_DIR_FD_SUPPORTED = os.open in os.supports_dir_fd
+
 class FileManager:
     """
     A class that handles all file management operations for the voice command generation system.
@@ -22,62 +49,237 @@ class FileManager:
         Args:
             config (AppConfig): The application configuration instance.
         """
+        from boto3.s3.transfer import TransferConfig, create_transfer_manager
+
         self.config = config
         self.local_base_path: Path = Path(config.get('LOCAL_STORAGE_PATH', '/tmp/femtosense_poc'))
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=config.get('AWS_ACCESS_KEY_ID'),
-            aws_secret_access_key=config.get('AWS_SECRET_ACCESS_KEY'),
-            region_name=config.get('AWS_REGION', 'us-west-2')
+        self.s3_client = get_s3_client(
+            config.get('AWS_ACCESS_KEY_ID'),
+            config.get('AWS_SECRET_ACCESS_KEY'),
+            config.get('AWS_REGION', 'us-west-2')
         )
         self.bucket_name = config.get('S3_BUCKET_NAME', 'femtosense-voice-commands')
+        self.transfer_manager = create_transfer_manager(self.s3_client, TransferConfig(**S3_TRANSFER_SETTINGS))
+        self._local_writer = concurrent.futures.ThreadPoolExecutor(
+            max_workers=LOCAL_WRITER_WORKERS,
+            thread_name_prefix='audio-writer'
+        )
 
         # Ensure the local base path exists
         self.local_base_path.mkdir(parents=True, exist_ok=True)
+        self._created_dirs: Set[Path] = {self.local_base_path}
+        self._dir_fds: 'OrderedDict[Path, int]' = OrderedDict()
+        self._dir_fds_lock = threading.Lock()
+
+        # Absolute output directory per (language, intent), bound to this instance's base path
+        self._local_dir = functools.lru_cache(maxsize=1024)(self._build_local_dir)
 
         logger.info(f"FileManager initialized with local base path: {self.local_base_path}")
 
-    def save_audio_file(self, audio_data: bytes, metadata: Dict[str, str]) -> Tuple[str, str]:
+    def save_audio_file(self, audio_data: bytes, metadata: Dict[str, str],
+                        local_copy: bool = True, upload: bool = True,
+                        copy_source: Optional[str] = None) -> Tuple[Optional[str], str]:
         """
-        Saves an audio file both locally and to S3, returning the local and S3 paths.
+        Saves an audio file to S3 and optionally locally, returning the local and S3 paths.
 
         Args:
             audio_data (bytes): The audio file data.
             metadata (Dict[str, str]): Metadata for the audio file, including language, intent, and variation.
+            local_copy (bool): Whether to also keep a copy in local storage.
+            upload (bool): Whether to upload the file to S3; callers that upload
+                the local copy themselves pass False.
+            copy_source (Optional[str]): S3 key of an existing object with the same content.
 
         Returns:
-            Tuple[str, str]: Local and S3 paths of the saved file.
-        """
-        # Generate file paths
-        relative_path = self._generate_file_path(metadata)
-        local_path = self.local_base_path / relative_path
-        s3_path = f"{metadata['language']}/{metadata['intent']}/{relative_path.name}"
-
-        # Ensure the local directory exists
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save file locally
-        with open(local_path, 'wb') as f:
-            f.write(audio_data)
-        logger.info(f"Audio file saved locally: {local_path}")
-
-        # Convert to WAV if necessary
-        if local_path.suffix.lower() != '.wav':
-            wav_path = local_path.with_suffix('.wav')
-            convert_to_wav(str(local_path), str(wav_path))
-            local_path = wav_path
-            s3_path = s3_path.rsplit('.', 1)[0] + '.wav'
-
-        # Upload file to S3
-        self.s3_client.upload_file(
-            str(local_path),
-            self.bucket_name,
-            s3_path,
-            ExtraArgs={'Metadata': metadata}
-        )
-        logger.info(f"Audio file uploaded to S3: {s3_path}")
+            Tuple[Optional[str], str]: Local path (None without a local copy) and S3 path of the saved file.
+        """
+        return self.save_audio_files([(audio_data, metadata)], local_copy, upload, [copy_source])[0]
+
+    def save_audio_files(self, audio_files: List[Tuple[bytes, Dict[str, str]]],
+                         local_copy: bool = True, upload: bool = True,
+                         copy_sources: Optional[List[Optional[str]]] = None) -> List[Tuple[Optional[str], str]]:
+        """
+        Uploads a batch of audio files to S3 concurrently, optionally keeping local copies.
+
+        All uploads are submitted to the shared transfer manager before waiting
+        on any of them, so the batch takes about as long as the slowest upload
+        rather than the sum of all uploads. Audio data is uploaded straight from
+        memory; local copies are written by background threads while the
+        uploads are in flight instead of being staged on disk first. Files whose
+        content already exists in the bucket are copied server-side instead of
+        being uploaded.
+
+        Args:
+            audio_files (List[Tuple[bytes, Dict[str, str]]]): Pairs of audio data and metadata.
+            local_copy (bool): Whether to also keep copies in local storage.
+            upload (bool): Whether to upload the files to S3; without it only the
+                local copies are written, and the returned S3 paths are the keys
+                the files should be uploaded to.
+            copy_sources (Optional[List[Optional[str]]]): S3 key of an existing object
+                with the same content for each file, or None where there is none.
+
+        Returns:
+            List[Tuple[Optional[str], str]]: Local paths (None without local copies)
+            and S3 paths of the saved files, in input order.
+        """
+        saved_files = []
+        futures = []
+        copy_sources = copy_sources or [None] * len(audio_files)
+        for (audio_data, metadata), copy_source in zip(audio_files, copy_sources):
+            local_dir, file_name, s3_path = self._resolve_paths(metadata)
+            if upload and copy_source and self._object_exists(copy_source):
+                futures.append(self.transfer_manager.copy(
+                    {'Bucket': self.bucket_name, 'Key': copy_source},
+                    self.bucket_name,
+                    s3_path,
+                    extra_args={'Metadata': metadata, 'MetadataDirective': 'REPLACE'}
+                ))
+            elif upload:
+                futures.append(self.transfer_manager.upload(
+                    io.BytesIO(audio_data),
+                    self.bucket_name,
+                    s3_path,
+                    extra_args={'Metadata': metadata}
+                ))
+            local_path = None
+            if local_copy:
+                local_path = os.path.join(str(local_dir), file_name)
+                futures.append(self._local_writer.submit(self._write_local_file, audio_data, local_dir, file_name))
+            saved_files.append((local_path, s3_path))
+
+        for future in futures:
+            future.result()
+        if upload:
+            logger.info(f"Uploaded {len(saved_files)} audio files to S3")
+
+        return saved_files
+
+    def _object_exists(self, s3_key: str) -> bool:
+        """
+        Checks whether an object exists in the bucket.
+
+        Args:
+            s3_key (str): The S3 key of the object.
+
+        Returns:
+            bool: True if the object exists.
+        """
+        from botocore.exceptions import ClientError
+
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError:
+            return False
+        return True
+
+    def _resolve_paths(self, metadata: Dict[str, str]) -> Tuple[Path, str, str]:
+        """
+        Resolves the local directory, file name and S3 path of an audio file from its metadata.
+
+        The directory is the cached Path shared by every file of the same
+        language and intent, so no Path object is built per file.
+
+        Args:
+            metadata (Dict[str, str]): Metadata for the audio file, including language, intent, and variation.
+
+        Returns:
+            Tuple[Path, str, str]: Local directory, file name and S3 path of the file.
+        """
+        language, intent = metadata['language'], metadata['intent']
+        file_name = _file_name(metadata)
+        return self._local_dir(language, intent), file_name, _intent_dir(language, intent)[1] + file_name
+
+    def _build_local_dir(self, language: str, intent: str) -> Path:
+        """
+        Builds the absolute local directory for a language and intent.
+
+        Only called through the per-instance cache set up in __init__.
+
+        Args:
+            language (str): The language of the audio files.
+            intent (str): The intent of the audio files.
+
+        Returns:
+            Path: Local directory for the audio files.
+        """
+        return self.local_base_path / _intent_dir(language, intent)[0]
+
+    def _write_local_file(self, audio_data: bytes, directory: Path, file_name: str) -> None:
+        """
+        Writes an audio file to local storage.
+
+        Where the platform allows it, the file is created relative to an
+        already open descriptor of its directory, so the kernel does not walk
+        the full path again for every file.
+
+        Args:
+            audio_data (bytes): The audio file data.
+            directory (Path): Local directory to write the file to.
+            file_name (str): Name of the file within the directory.
+        """
+        if _DIR_FD_SUPPORTED:
+            with self._dir_fds_lock:
+                fd = os.open(file_name, _WRITE_FLAGS, 0o644, dir_fd=self._dir_fd(directory))
+        else:
+            self._ensure_dir(directory)
+            fd = os.open(os.path.join(directory, file_name), _WRITE_FLAGS, 0o644)
+
+        _write_fd(fd, audio_data)
+        logger.info(f"Audio file saved locally: {os.path.join(directory, file_name)}")
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """
+        Creates a local directory unless it has already been created.
+
+        Args:
+            directory (Path): The directory to create.
+        """
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def _dir_fd(self, directory: Path) -> int:
+        """
+        Returns an open descriptor for a local directory, creating it if needed.
+
+        Descriptors are kept in a small LRU cache; the least recently used one
+        is closed once the cache is full. Callers must hold _dir_fds_lock.
+
+        Args:
+            directory (Path): The directory to open.
 
-        return str(local_path), s3_path
+        Returns:
+            int: Open file descriptor of the directory.
+        """
+        dir_fd = self._dir_fds.get(directory)
+        if dir_fd is not None:
+            self._dir_fds.move_to_end(directory)
+            return dir_fd
+
+        self._ensure_dir(directory)
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        self._dir_fds[directory] = dir_fd
+        if len(self._dir_fds) > DIR_FD_CACHE_SIZE:
+            _, evicted_fd = self._dir_fds.popitem(last=False)
+            os.close(evicted_fd)
+        return dir_fd
+
+    def __enter__(self) -> 'FileManager':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Waits for pending local writes and uploads, and closes cached directory descriptors.
+        """
+        self._local_writer.shutdown(wait=True)
+        self.transfer_manager.shutdown()
+        with self._dir_fds_lock:
+            for dir_fd in self._dir_fds.values():
+                os.close(dir_fd)
+            self._dir_fds.clear()
 
     def get_audio_file(self, file_path: str, prefer_local: bool = True) -> bytes:
         """
@@ -97,13 +299,90 @@ class FileManager:
                 audio_data = f.read()
             logger.info(f"Audio file retrieved from local storage: {local_path}")
         else:
-            s3_path = file_path.replace(str(self.local_base_path), '').lstrip('/')
+            s3_path = self._s3_key(file_path)
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_path)
             audio_data = response['Body'].read()
             logger.info(f"Audio file retrieved from S3: {s3_path}")
 
         return audio_data
 
+    @contextlib.contextmanager
+    def open_audio_file_view(self, file_path: str) -> Iterator[memoryview]:
+        """
+        Maps a locally stored audio file into memory and yields a read-only view of it.
+
+        Unlike get_audio_file, the file is not copied into a new bytes object;
+        pages are read from the OS page cache as the view is accessed. The
+        mapping is closed when the block exits, so the view and any slices
+        of it must not be used or kept past the block.
+
+        Args:
+            file_path (str): The path of the file, relative to local storage.
+
+        Yields:
+            memoryview: Read-only view of the file contents.
+
+        Raises:
+            FileNotFoundError: If the file is not stored locally.
+        """
+        with open(self.local_base_path / file_path, 'rb') as f:
+            # Empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                yield memoryview(b'')
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def get_audio_files(self, file_paths: List[str], prefer_local: bool = True) -> List[bytes]:
+        """
+        Retrieves a batch of audio files, downloading those not stored locally concurrently.
+
+        All S3 downloads are submitted to the shared transfer manager before
+        waiting on any of them, so the batch takes about as long as the slowest
+        download rather than the sum of all downloads. Objects above the
+        multipart threshold are fetched as concurrent ranged requests.
+
+        Args:
+            file_paths (List[str]): The paths of the files to retrieve.
+            prefer_local (bool): Whether to prefer local storage over S3 if available.
+
+        Returns:
+            List[bytes]: Audio file data, in input order.
+        """
+        buffers: List[Any] = []
+        futures = []
+        for file_path in file_paths:
+            local_path = self.local_base_path / file_path
+            if prefer_local and local_path.exists():
+                with open(local_path, 'rb') as f:
+                    buffers.append(f.read())
+            else:
+                buffer = io.BytesIO()
+                futures.append(self.transfer_manager.download(self.bucket_name, self._s3_key(file_path), buffer))
+                buffers.append(buffer)
+
+        for future in futures:
+            future.result()
+        logger.info(f"Retrieved {len(buffers)} audio files, {len(futures)} of them from S3")
+
+        return [buffer.getvalue() if isinstance(buffer, io.BytesIO) else buffer for buffer in buffers]
+
+    def _s3_key(self, file_path: str) -> str:
+        """
+        Returns the S3 key of a file given by its local or relative path.
+
+        Args:
+            file_path (str): The path of the file.
+
+        Returns:
+            str: S3 key of the file.
+        """
+        return file_path.replace(str(self.local_base_path), '').lstrip('/')
+
     def delete_audio_file(self, file_path: str) -> bool:
         """
         Deletes an audio file from both local storage and S3.
@@ -115,7 +394,7 @@ class FileManager:
             bool: Success status of deletion.
         """
         local_path = self.local_base_path / file_path
-        s3_path = file_path.replace(str(self.local_base_path), '').lstrip('/')
+        s3_path = self._s3_key(file_path)
 
         # Delete from local storage
         if local_path.exists():
@@ -142,32 +421,94 @@ class FileManager:
         Returns:
             List[str]: List of file paths.
         """
-        prefix = f"{language}/{intent}/"
-        response = self.s3_client.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix)
-
-        file_list = []
-        if 'Contents' in response:
-            for obj in response['Contents']:
-                file_list.append(obj['Key'])
-
+        file_list = list(self.iter_audio_files(intent, language))
         logger.info(f"Listed {len(file_list)} audio files for intent '{intent}' in language '{language}'")
         return file_list
 
-    def _generate_file_path(self, metadata: Dict[str, str]) -> Path:
+    def iter_audio_files(self, intent: str, language: str) -> Iterator[str]:
         """
-        Generates a file path based on metadata.
+        Yields every audio file for a given intent and language, one listing page at a time.
+
+        The intent directory is passed to S3 as the key prefix, so filtering
+        happens server-side. Pages are fetched through the list_objects_v2
+        paginator, so intents with more than 1000 files are listed completely.
+
+        Args:
+            intent (str): The intent to list files for.
+            language (str): The language to list files for.
+
+        Yields:
+            str: Path of each file.
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=_intent_dir(language, intent)[1],
+                                       PaginationConfig={'PageSize': 1000}):
+            for obj in page.get('Contents', ()):
+                yield obj['Key']
+
+    def _generate_file_path(self, metadata: Dict[str, str]) -> Tuple[Path, str]:
+        """
+        Generates the relative file path and S3 key based on metadata.
+
+        Audio is always stored as WAV, so both carry the .wav suffix.
 
         Args:
             metadata (Dict[str, str]): Metadata for the audio file.
 
         Returns:
-            Path: Generated file path.
+            Tuple[Path, str]: Relative local file path and S3 key.
         """
-        return Path(
-            metadata['language'],
-            metadata['intent'],
-            f"{metadata['variation']}_{metadata.get('voice_id', 'default')}.wav"
-        )
+        intent_dir, s3_prefix = _intent_dir(metadata['language'], metadata['intent'])
+        file_name = _file_name(metadata)
+        return intent_dir / file_name, s3_prefix + file_name
+
+@functools.lru_cache(maxsize=None)
+def _intent_dir(language: str, intent: str) -> Tuple[Path, str]:
+    """
+    Returns the relative directory and S3 key prefix for a language and intent.
+
+    There are only a handful of (language, intent) pairs, so these are built
+    once and reused for every file.
+
+    Args:
+        language (str): The language of the audio files.
+        intent (str): The intent of the audio files.
+
+    Returns:
+        Tuple[Path, str]: Relative directory path and S3 key prefix.
+    """
+    return Path(language, intent), f"{language}/{intent}/"
+
+def _file_name(metadata: Dict[str, str]) -> str:
+    """
+    Returns the WAV file name of an audio file from its metadata.
+
+    Args:
+        metadata (Dict[str, str]): Metadata for the audio file.
+
+    Returns:
+        str: File name of the audio file.
+    """
+    return f"{metadata['variation']}_{metadata.get('voice_id', 'default')}.wav"
+
+def _write_fd(fd: int, data: bytes) -> None:
+    """
+    Writes bytes to an open file descriptor with unbuffered OS-level calls, then closes it.
+
+    Audio files are written in one piece, so going through os.write skips the
+    buffered file object and normally costs a single write syscall.
+
+    Args:
+        fd (int): File descriptor opened for writing.
+        data (bytes): Data to write.
+    """
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
 # Initialize the global FILE_MANAGER_CONFIG
 FILE_MANAGER_CONFIG = {
@@ -1,9 +1,30 @@
-import pandas as pd
-from typing import List, Dict, Any
+import re
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
+from typing import TYPE_CHECKING, BinaryIO, FrozenSet, List, Dict, Any, Tuple, Union
 from ..utils.logger import logger, log_decorator
 from ..utils.error_handler import ValidationError
 from ..config.app_config import APP_CONFIG
 
+# pandas is only needed for Excel input; it is imported there to keep CSV runs fast
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Characters removed from phrases: anything but letters, digits and whitespace
+SANITIZE_PATTERN: str = r'[^\w\s]|_'
+_INVALID_CHARS_RE = re.compile(SANITIZE_PATTERN)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Deletion table for the ASCII characters SANITIZE_PATTERN removes; str.translate
+# applies it in a single C loop, so ASCII phrases skip the regex substitution
+_ASCII_INVALID_CHARS_TABLE = str.maketrans('', '', ''.join(
+    char for char in map(chr, range(128)) if _INVALID_CHARS_RE.match(char)
+))
+
+# Leading bytes of Excel workbooks: .xlsx is a ZIP archive, .xls an OLE2 compound file
+EXCEL_SIGNATURES = (b'PK\x03\x04', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1')
+
 class InputProcessor:
     """
     Main class responsible for processing input files and validating their contents.
@@ -22,7 +43,10 @@ class InputProcessor:
             config (Any): Application configuration object.
         """
         self.config = config
-        self.supported_languages: List[str] = APP_CONFIG.SUPPORTED_LANGUAGES
+        self.supported_languages: FrozenSet[str] = frozenset(
+            language.lower() for language in APP_CONFIG.SUPPORTED_LANGUAGES
+        )
+        self._supported_languages_array = pa.array(sorted(self.supported_languages))
         self.required_columns: List[str] = ['intent', 'phrase', 'language']
         self.logger = logger.setup_logger(__name__, APP_CONFIG.DEFAULT_LOG_LEVEL)
 
@@ -31,6 +55,12 @@ class InputProcessor:
         """
         Processes an input file and returns a list of validated voice command dictionaries.
 
+        The file is opened once; its leading bytes decide whether it is parsed
+        as Excel or CSV, and the same handle is passed to the parser. CSV files
+        are parsed with the multithreaded Arrow reader, so pandas is only
+        loaded for Excel workbooks. Either way, the result matches
+        applying validate_row to each row and dropping the rows it rejects.
+
         Args:
             file_path (str): Path to the input file.
             skip_header (int): Number of header rows to skip.
@@ -45,28 +75,145 @@ class InputProcessor:
             raise ValidationError(f"Invalid file format. Supported formats are CSV and Excel.")
 
         try:
-            df = pd.read_csv(file_path, skiprows=skip_header) if file_path.endswith('.csv') else pd.read_excel(file_path, skiprows=skip_header)
+            with open(file_path, 'rb') as f:
+                head = f.read(8)
+                f.seek(0)
+                if head.startswith(EXCEL_SIGNATURES):
+                    validated_commands, total_rows = self._validate_excel(f, skip_header)
+                else:
+                    validated_commands, total_rows = self._validate_csv(f, skip_header)
+        except ValidationError:
+            raise
         except Exception as e:
             self.logger.error(f"Error reading file {file_path}: {str(e)}")
             raise ValidationError(f"Error reading file: {str(e)}")
 
-        if not all(col in df.columns for col in self.required_columns):
-            missing_cols = set(self.required_columns) - set(df.columns)
+        skipped = total_rows - len(validated_commands)
+        if skipped:
+            self.logger.warning(f"Skipping {skipped} invalid rows (unsupported language or empty intent/phrase)")
+
+        self.logger.info(f"Processed {len(validated_commands)} valid commands from {file_path}")
+        return validated_commands
+
+    def _validate_csv(self, source: Union[str, BinaryIO], skip_header: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Reads and validates the rows of a CSV file with the Arrow CSV reader.
+
+        The file is parsed into columns in native code and rows in unsupported
+        languages are dropped on the Arrow columns; only the remaining values
+        are converted to Python strings and validated row by row, in file order.
+
+        Args:
+            source (Union[str, BinaryIO]): Path to the CSV file, or an open binary handle.
+            skip_header (int): Number of lines to skip before the column names.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Validated commands and the number of rows read.
+
+        Raises:
+            ValidationError: If required columns are missing.
+        """
+        table = self._read_csv_table(source, skip_header)
+        missing_cols = set(self.required_columns) - set(table.column_names)
+        if missing_cols:
             raise ValidationError(f"Missing required columns: {', '.join(missing_cols)}")
 
+        languages = pc.utf8_lower(table.column('language'))
+        supported = pc.is_in(languages, value_set=self._supported_languages_array)
+
         validated_commands = []
-        for _, row in df.iterrows():
-            try:
-                validated_row = self.validate_row(row)
-                validated_commands.append(validated_row)
-            except ValidationError as ve:
-                self.logger.warning(f"Skipping invalid row: {str(ve)}")
+        for intent, phrase, language in zip(table.column('intent').filter(supported).to_pylist(),
+                                            table.column('phrase').filter(supported).to_pylist(),
+                                            languages.filter(supported).to_pylist()):
+            intent = (intent or '').strip().upper()
+            phrase = self._sanitize_phrase(phrase or '')
+            if intent and phrase:
+                validated_commands.append({'intent': intent, 'phrase': phrase, 'language': language})
+
+        return validated_commands, table.num_rows
+
+    def _validate_excel(self, f: BinaryIO, skip_header: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Reads an Excel workbook and validates its rows with validate_frame.
+
+        Args:
+            f (BinaryIO): Open binary handle of the workbook.
+            skip_header (int): Number of rows to skip before the column names.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Validated commands and the number of rows read.
+
+        Raises:
+            ValidationError: If required columns are missing.
+        """
+        import pandas as pd
+
+        df = pd.read_excel(f, skiprows=skip_header)
+        return self.validate_frame(df), len(df)
+
+    @log_decorator('info')
+    def process_input_file(self, file_path: str, skip_header: int = 0) -> List[Dict[str, Any]]:
+        """
+        Processes a CSV input file using Arrow's columnar reader.
+
+        Rows are parsed and validated like process_file does for CSV files;
+        duplicates are then dropped after sanitization, keeping the first
+        occurrence, so the result follows the order of the input file.
+
+        Args:
+            file_path (str): Path to the CSV input file.
+            skip_header (int): Number of lines to skip before the column names.
+
+        Returns:
+            List[Dict[str, Any]]: List of validated, de-duplicated voice command dictionaries.
+
+        Raises:
+            ValidationError: If the file cannot be read or required columns are missing.
+        """
+        if not file_path.endswith('.csv'):
+            return self.process_file(file_path, skip_header)
+
+        try:
+            commands, _ = self._validate_csv(file_path, skip_header)
+        except (pa.ArrowInvalid, OSError) as e:
+            self.logger.error(f"Error reading file {file_path}: {str(e)}")
+            raise ValidationError(f"Error reading file: {str(e)}")
+
+        unique_commands = dict.fromkeys(
+            (command['intent'], command['phrase'], command['language']) for command in commands
+        )
+        validated_commands = [
+            {'intent': intent, 'phrase': phrase, 'language': language}
+            for intent, phrase, language in unique_commands
+        ]
 
         self.logger.info(f"Processed {len(validated_commands)} valid commands from {file_path}")
         return validated_commands
 
+    def _read_csv_table(self, file_path: Union[str, BinaryIO], skip_header: int = 0) -> pa.Table:
+        """
+        Reads a CSV file into an Arrow table with the multithreaded Arrow parser.
+
+        Required columns are read as strings so that values such as intents made
+        of digits are not converted to numbers.
+
+        Args:
+            file_path (Union[str, BinaryIO]): Path to the CSV file, or an open binary handle.
+            skip_header (int): Number of lines to skip before the column names.
+
+        Returns:
+            pa.Table: The parsed file.
+        """
+        return pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(skip_rows=skip_header),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={column: pa.string() for column in self.required_columns}
+            )
+        )
+
     @log_decorator('debug')
-    def validate_row(self, row: pd.Series) -> Dict[str, Any]:
+    def validate_row(self, row: 'pd.Series') -> Dict[str, Any]:
         """
         Validates a single row from the input file and transforms it into the required format.
 
@@ -95,6 +242,45 @@ class InputProcessor:
             'language': language
         }
 
+    @log_decorator('debug')
+    def validate_frame(self, df: 'pd.DataFrame') -> List[Dict[str, Any]]:
+        """
+        Validates all rows of an input DataFrame at once with vectorized column operations.
+
+        The result matches applying validate_row to each row and dropping the
+        rows it rejects, but the normalization and the language check run over
+        whole columns instead of one pd.Series per row.
+
+        Args:
+            df (pd.DataFrame): Input rows with at least the required columns.
+
+        Returns:
+            List[Dict[str, Any]]: Validated and transformed rows, in input order.
+
+        Raises:
+            ValidationError: If required columns are missing.
+        """
+        import pandas as pd
+
+        missing_cols = set(self.required_columns) - set(df.columns)
+        if missing_cols:
+            raise ValidationError(f"Missing required columns: {', '.join(missing_cols)}")
+
+        df = df[self.required_columns].fillna('').astype(str)
+        df['language'] = df['language'].str.lower()
+        df['intent'] = df['intent'].str.strip().str.upper()
+        df['phrase'] = (
+            df['phrase']
+            .str.replace(_WHITESPACE_RE, ' ', regex=True)
+            .str.strip()
+            .str.replace(_INVALID_CHARS_RE, '', regex=True)
+        )
+
+        # Unsupported languages have no category and get code -1
+        languages = pd.Categorical(df['language'], categories=sorted(self.supported_languages))
+        mask = (languages.codes != -1) & (df['intent'] != '').to_numpy() & (df['phrase'] != '').to_numpy()
+        return df.loc[mask, self.required_columns].to_dict('records')
+
     @log_decorator('debug')
     def map_intent(self, phrase: str, intent_column: str) -> str:
         """
@@ -136,10 +322,12 @@ class InputProcessor:
             str: Sanitized phrase.
         """
         # Remove leading/trailing whitespace and normalize internal whitespace
-        sanitized = ' '.join(phrase.split())
-        # Remove any non-alphanumeric characters except spaces
-        sanitized = ''.join(char for char in sanitized if char.isalnum() or char.isspace())
-        return sanitized
+        phrase = ' '.join(phrase.split())
+        # Remove any non-alphanumeric characters except spaces; non-ASCII phrases
+        # need the Unicode-aware pattern
+        if phrase.isascii():
+            return phrase.translate(_ASCII_INVALID_CHARS_TABLE)
+        return _INVALID_CHARS_RE.sub('', phrase)
 
 # Example usage:
 # input_processor = InputProcessor(APP_CONFIG)
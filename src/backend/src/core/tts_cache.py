@@ -0,0 +1,146 @@
+import os
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Optional
+from ..utils.logger import logger
+
+# Default local directory for cached TTS audio
+DEFAULT_TTS_CACHE_DIR: str = os.environ.get('TTS_CACHE_DIR', '/tmp/femtosense_poc/tts_cache')
+# S3 prefix under which cached TTS audio is mirrored
+TTS_CACHE_S3_PREFIX: str = 'cache'
+
+class TTSCache:
+    """
+    Content-addressed cache for synthesized TTS audio.
+
+    Audio is keyed by sha256(language|voice|phrase) and stored as one file per key
+    in a local directory. When an S3 client is provided, entries are mirrored to
+    s3://<bucket>/cache/<key>.wav so that other machines and later runs can reuse
+    them without calling the TTS service again.
+
+    Requirements addressed:
+    - High-Quality Audio Dataset Creation (Technical Specification/1.1 SYSTEM OBJECTIVES/2)
+    - Scalable Data Management (Technical Specification/1.1 SYSTEM OBJECTIVES/3)
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_TTS_CACHE_DIR, s3_client: Any = None, bucket_name: Optional[str] = None):
+        """
+        Initializes the TTSCache.
+
+        Args:
+            cache_dir (str): Local directory holding cached audio files.
+            s3_client (Any): Optional boto3 S3 client used to mirror cache entries.
+            bucket_name (Optional[str]): Bucket used for the S3 mirror.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(language: str, voice: str, phrase: str) -> str:
+        """
+        Builds the cache key for a synthesized phrase.
+
+        Args:
+            language (str): The language of the phrase.
+            voice (str): The voice used for synthesis.
+            phrase (str): The synthesized text.
+
+        Returns:
+            str: Hex encoded sha256 digest identifying the audio.
+        """
+        return hashlib.sha256(f"{language}|{voice}|{phrase}".encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def s3_key(key: str) -> str:
+        """
+        Returns the S3 key of the mirrored cache entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str: S3 key of the cache entry.
+        """
+        return f"{TTS_CACHE_S3_PREFIX}/{key}.wav"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Looks up cached audio, first locally and then in the S3 mirror.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[bytes]: Cached audio data, or None on a cache miss.
+        """
+        local_path = self.cache_dir / f"{key}.wav"
+        audio_data = None
+        if local_path.exists():
+            audio_data = local_path.read_bytes()
+        elif self._has_mirror():
+            # botocore is only loaded once the S3 mirror is actually used
+            from botocore.exceptions import ClientError
+
+            try:
+                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self.s3_key(key))
+                audio_data = response['Body'].read()
+                self._write_local(key, audio_data)
+            except ClientError:
+                audio_data = None
+
+        with self._lock:
+            if audio_data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return audio_data
+
+    def put(self, key: str, audio_data: bytes) -> None:
+        """
+        Stores synthesized audio in the local cache and the S3 mirror.
+
+        Args:
+            key (str): The cache key.
+            audio_data (bytes): The synthesized audio data.
+        """
+        self._write_local(key, audio_data)
+        if self._has_mirror():
+            from botocore.exceptions import ClientError
+
+            try:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=self.s3_key(key),
+                    Body=audio_data,
+                    ContentType='audio/wav'
+                )
+            except ClientError as e:
+                logger.warning(f"Failed to mirror TTS cache entry {key} to S3: {str(e)}")
+
+    def _write_local(self, key: str, audio_data: bytes) -> None:
+        """
+        Atomically writes a cache entry to the local cache directory.
+
+        Args:
+            key (str): The cache key.
+            audio_data (bytes): The audio data to store.
+        """
+        local_path = self.cache_dir / f"{key}.wav"
+        tmp_path = local_path.with_name(f"{local_path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(audio_data)
+        os.replace(tmp_path, local_path)
+
+    def _has_mirror(self) -> bool:
+        """
+        Checks whether the S3 mirror is configured.
+
+        Returns:
+            bool: True if cache entries are mirrored to S3.
+        """
+        return self.s3_client is not None and bool(self.bucket_name)
@@ -1,10 +1,33 @@
-import boto3
-from botocore.exceptions import ClientError
-from typing import Dict, List, Optional
+import io
+import asyncio
+import functools
+import itertools
+import concurrent.futures
+from typing import IO, Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from ..utils.logger import logger, log_decorator
 from ..config.app_config import APP_CONFIG
 from ..utils.error_handler import FileSystemError
+from ..utils.async_pipeline import map_unordered
+from ..utils.s3_client import get_s3_client
+
+# Maximum number of files uploaded concurrently by upload_files
+MAX_UPLOAD_WORKERS: int = 32
+# Objects above this size are copied server-side with UploadPartCopy
+COPY_MULTIPART_THRESHOLD: int = 8 * 1024 * 1024
+# Size of each part of a multipart server-side copy
+COPY_MULTIPART_CHUNKSIZE: int = 16 * 1024 * 1024
+# In-memory audio above this size is uploaded in parallel parts of the same size
+TRANSFER_MULTIPART_THRESHOLD: int = 20 * 1024 * 1024
+# Maximum number of keys S3 accepts in one DeleteObjects request
+DELETE_BATCH_SIZE: int = 1000
+
+# Folder structure of generated audio joined into one format string, built once
+_FOLDER_STRUCTURE = APP_CONFIG.aws_config['s3']['folder_structure']
+_S3_PATH_TEMPLATE: str = (
+    f"{_FOLDER_STRUCTURE['language']}/{_FOLDER_STRUCTURE['intent']}/"
+    f"{_FOLDER_STRUCTURE['variation']}/{{voice_id}}.wav"
+)
 
 class AWSService:
     """
@@ -23,23 +46,44 @@ class AWSService:
         Args:
             config (AppConfig): Application configuration instance.
         """
+        from boto3.s3.transfer import TransferConfig
+
         self.config = config
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=config.aws_config['credentials']['access_key_id'],
-            aws_secret_access_key=config.aws_config['credentials']['secret_access_key'],
-            region_name=config.aws_config['s3']['region']
+        self.s3_client = get_s3_client(
+            config.aws_config['credentials']['access_key_id'],
+            config.aws_config['credentials']['secret_access_key'],
+            config.aws_config['s3']['region']
         )
         self.bucket_name = config.aws_config['s3']['bucket_name']
+        # Regional virtual-hosted URL prefix of uploaded objects, built once
+        self._url_prefix = f"https://{self.bucket_name}.s3.{config.aws_config['s3']['region']}.amazonaws.com/"
+        self._transfer_config = TransferConfig(
+            multipart_threshold=TRANSFER_MULTIPART_THRESHOLD,
+            multipart_chunksize=TRANSFER_MULTIPART_THRESHOLD,
+            max_concurrency=10,
+            use_threads=True
+        )
+        self._copy_config = TransferConfig(
+            multipart_threshold=COPY_MULTIPART_THRESHOLD,
+            multipart_chunksize=COPY_MULTIPART_CHUNKSIZE,
+            max_concurrency=16
+        )
 
     @log_decorator(level="INFO")
-    def upload_audio_file(self, file_path: str, audio_data: bytes, metadata: Dict[str, str]) -> str:
+    def upload_audio_file(self, file_path: str, audio: Union[bytes, IO[bytes]], metadata: Dict[str, str]) -> str:
         """
         Uploads an audio file to AWS S3 and returns the S3 URL.
 
+        Audio may be given as bytes or as a readable binary stream, such as the
+        output of convert_audio_stream. Streams are read in parts by the
+        managed transfer, which uploads them concurrently, so they are never
+        fully loaded into memory. Bytes below TRANSFER_MULTIPART_THRESHOLD are
+        sent with a single PutObject; larger bytes go through the managed
+        transfer as well.
+
         Args:
             file_path (str): The S3 path where the file will be stored.
-            audio_data (bytes): The audio file data.
+            audio (Union[bytes, IO[bytes]]): The audio file data or a stream of it.
             metadata (Dict[str, str]): Metadata to be attached to the S3 object.
 
         Returns:
@@ -48,15 +92,26 @@ class AWSService:
         Raises:
             FileSystemError: If there's an error during the upload process.
         """
+        from botocore.exceptions import ClientError
+
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=file_path,
-                Body=audio_data,
-                Metadata=metadata,
-                ContentType='audio/wav'
-            )
-            s3_url = f"https://{self.bucket_name}.s3.amazonaws.com/{file_path}"
+            if not hasattr(audio, 'read') and len(audio) < TRANSFER_MULTIPART_THRESHOLD:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=file_path,
+                    Body=audio,
+                    Metadata=metadata,
+                    ContentType='audio/wav'
+                )
+            else:
+                self.s3_client.upload_fileobj(
+                    audio if hasattr(audio, 'read') else io.BytesIO(audio),
+                    self.bucket_name,
+                    file_path,
+                    ExtraArgs={'Metadata': metadata, 'ContentType': 'audio/wav'},
+                    Config=self._transfer_config
+                )
+            s3_url = self._url_prefix + file_path
             logger.info(f"Successfully uploaded file to S3: {s3_url}")
             return s3_url
         except ClientError as e:
@@ -64,6 +119,232 @@ class AWSService:
             logger.error(error_message)
             raise FileSystemError(error_message)
 
+    @log_decorator(level="INFO")
+    def bulk_upload(self, items: List[Tuple[str, Union[bytes, IO[bytes]], Dict[str, str]]]) -> List[str]:
+        """
+        Uploads a batch of in-memory audio files to AWS S3 concurrently.
+
+        Each file goes through upload_audio_file on a thread pool scoped to the
+        call, so request latency overlaps across files while all threads share
+        the pooled S3 client. Files that fail to upload are logged and left out
+        of the result.
+
+        Args:
+            items (List[Tuple[str, Union[bytes, IO[bytes]], Dict[str, str]]]): S3
+                path, audio data or stream, and metadata of each file.
+
+        Returns:
+            List[str]: S3 URLs of the successfully uploaded files.
+        """
+        uploaded_files = []
+        if not items:
+            return uploaded_files
+
+        max_workers = min(MAX_UPLOAD_WORKERS, len(items))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_key = {
+                executor.submit(self.upload_audio_file, file_path, audio, metadata): file_path
+                for file_path, audio, metadata in items
+            }
+            for future in concurrent.futures.as_completed(future_to_key):
+                file_path = future_to_key.pop(future)
+                try:
+                    uploaded_files.append(future.result())
+                except FileSystemError as e:
+                    logger.error(f"Error uploading file to S3: {file_path}. Error: {str(e)}")
+
+        logger.info(f"Uploaded {len(uploaded_files)} of {len(items)} files to S3")
+        return uploaded_files
+
+    @log_decorator(level="INFO")
+    def upload_files(self, audio_files: List[Tuple[str, str]],
+                     copy_sources: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        Uploads a batch of local audio files to AWS S3 concurrently.
+
+        Each file goes through the managed transfer of the shared S3 client on
+        a thread pool scoped to the call. Files whose content already exists in
+        the bucket are copied server-side instead. Files that fail to upload
+        are logged and left out of the result.
+
+        Args:
+            audio_files (List[Tuple[str, str]]): Pairs of local file path and S3 key.
+            copy_sources (Optional[Dict[str, str]]): S3 keys of existing objects
+                with the same content, by destination S3 key.
+
+        Returns:
+            List[str]: S3 URLs of the successfully uploaded files.
+        """
+        uploaded_files = []
+        if not audio_files:
+            return uploaded_files
+
+        copy_sources = copy_sources or {}
+        max_workers = min(MAX_UPLOAD_WORKERS, len(audio_files))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_key = {
+                executor.submit(self._upload_local_file, local_path, s3_key,
+                                copy_sources.get(s3_key)): s3_key
+                for local_path, s3_key in audio_files
+            }
+            for future in concurrent.futures.as_completed(future_to_key):
+                s3_key = future_to_key.pop(future)
+                try:
+                    uploaded_files.append(future.result())
+                except (FileSystemError, OSError) as e:
+                    logger.error(f"Error uploading file to S3: {s3_key}. Error: {str(e)}")
+
+        logger.info(f"Uploaded {len(uploaded_files)} of {len(audio_files)} files to S3")
+        return uploaded_files
+
+    async def iter_upload_files(self, audio_files: AsyncIterator[Tuple[str, str]],
+                                copy_sources: Optional[Dict[str, str]] = None) -> AsyncIterator[str]:
+        """
+        Streams uploads for a stream of local audio files.
+
+        Uploads start as soon as files arrive from the upstream stage, with at
+        most MAX_UPLOAD_WORKERS transfers in flight. Failed uploads are logged
+        and skipped.
+
+        Args:
+            audio_files (AsyncIterator[Tuple[str, str]]): Pairs of local file path and S3 key.
+            copy_sources (Optional[Dict[str, str]]): S3 keys of existing objects
+                with the same content, by destination S3 key. May be filled in
+                by the upstream stage while the stream is running.
+
+        Yields:
+            str: S3 URL of each uploaded file.
+        """
+        loop = asyncio.get_running_loop()
+        copy_sources = {} if copy_sources is None else copy_sources
+
+        async def upload(item: Tuple[str, str]) -> Optional[str]:
+            local_path, s3_key = item
+            try:
+                return await loop.run_in_executor(
+                    None, self._upload_local_file, local_path, s3_key, copy_sources.get(s3_key)
+                )
+            except (FileSystemError, OSError) as e:
+                logger.error(f"Error uploading file to S3: {s3_key}. Error: {str(e)}")
+                return None
+
+        async for s3_url in map_unordered(upload, audio_files, window=MAX_UPLOAD_WORKERS):
+            yield s3_url
+
+    def _upload_local_file(self, local_path: str, s3_key: str, copy_source: Optional[str] = None) -> str:
+        """
+        Uploads a single local file to AWS S3.
+
+        When copy_source names an existing object with the same content, the
+        object is copied server-side and no bytes are sent from the client.
+        Otherwise the file goes through the managed transfer, which sends files
+        below TRANSFER_MULTIPART_THRESHOLD as a single PutObject and larger ones
+        as parallel parts, with botocore's retries and checksums either way.
+
+        Args:
+            local_path (str): Path of the local file to upload.
+            s3_key (str): The S3 key where the file will be stored.
+            copy_source (Optional[str]): S3 key of an object with the same content.
+
+        Returns:
+            str: S3 URL of the uploaded file.
+
+        Raises:
+            FileSystemError: If S3 rejects the upload or the copy.
+            OSError: If the file cannot be read.
+        """
+        from boto3.exceptions import S3UploadFailedError
+        from botocore.exceptions import ClientError
+
+        s3_url = self._url_prefix + s3_key
+        try:
+            if copy_source and self._copy_existing_object(copy_source, s3_key):
+                return s3_url
+
+            self.s3_client.upload_file(
+                local_path,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={'ContentType': 'audio/wav'},
+                Config=self._transfer_config
+            )
+        except (ClientError, S3UploadFailedError) as e:
+            raise FileSystemError(f"Error uploading file to S3: {str(e)}")
+        return s3_url
+
+    def _copy_existing_object(self, source_key: str, s3_key: str) -> bool:
+        """
+        Copies an object within the bucket without transferring it through the client.
+
+        Large objects are copied in parts with UploadPartCopy by the managed copy.
+
+        Args:
+            source_key (str): The S3 key of the object to copy.
+            s3_key (str): The destination S3 key.
+
+        Returns:
+            bool: True if the object was copied, False if the source does not exist.
+        """
+        from botocore.exceptions import ClientError
+
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=source_key)
+        except ClientError:
+            return False
+        self._copy_object(source_key, s3_key)
+        logger.debug(f"Copied cached object {source_key} to {s3_key} server-side")
+        return True
+
+    @log_decorator(level="INFO")
+    def copy_audio_file(self, src_key: str, dst_key: str, src_bucket: Optional[str] = None) -> str:
+        """
+        Copies an audio file to another key without transferring it through the client.
+
+        The data stays inside S3; objects above COPY_MULTIPART_THRESHOLD are
+        copied as concurrent UploadPartCopy requests.
+
+        Args:
+            src_key (str): The S3 path of the file to copy.
+            dst_key (str): The S3 path to copy the file to.
+            src_bucket (Optional[str]): Bucket holding the source file; defaults
+                to the service bucket.
+
+        Returns:
+            str: S3 URL of the copied file.
+
+        Raises:
+            FileSystemError: If there's an error during the copy process.
+        """
+        from botocore.exceptions import ClientError
+
+        try:
+            self._copy_object(src_key, dst_key, src_bucket)
+        except ClientError as e:
+            error_message = f"Error copying file in S3: {str(e)}"
+            logger.error(error_message)
+            raise FileSystemError(error_message)
+
+        s3_url = self._url_prefix + dst_key
+        logger.info(f"Successfully copied file in S3: {src_key} -> {s3_url}")
+        return s3_url
+
+    def _copy_object(self, source_key: str, s3_key: str, source_bucket: Optional[str] = None) -> None:
+        """
+        Copies an object into the service bucket with the managed, multipart-aware copy.
+
+        Args:
+            source_key (str): The S3 key of the object to copy.
+            s3_key (str): The destination S3 key.
+            source_bucket (Optional[str]): Bucket of the source object; defaults
+                to the service bucket.
+        """
+        self.s3_client.copy(
+            {'Bucket': source_bucket or self.bucket_name, 'Key': source_key},
+            self.bucket_name,
+            s3_key,
+            Config=self._copy_config
+        )
+
     @log_decorator(level="INFO")
     def download_audio_file(self, file_path: str) -> bytes:
         """
@@ -78,6 +359,8 @@ class AWSService:
         Raises:
             FileSystemError: If there's an error during the download process.
         """
+        from botocore.exceptions import ClientError
+
         try:
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_path)
             audio_data = response['Body'].read()
@@ -102,15 +385,73 @@ class AWSService:
         Raises:
             FileSystemError: If there's an error during the deletion process.
         """
+        if file_path not in self.delete_audio_files([file_path]):
+            raise FileSystemError(f"Error deleting file from S3: {file_path}")
+        logger.info(f"Successfully deleted file from S3: {file_path}")
+        return True
+
+    @log_decorator(level="INFO")
+    def delete_audio_files(self, keys: Iterable[str]) -> List[str]:
+        """
+        Deletes audio files from AWS S3 in bulk.
+
+        Keys are consumed lazily and sent in DeleteObjects requests of up to
+        DELETE_BATCH_SIZE keys, so a thousand files cost one round trip instead
+        of a thousand. Keys S3 fails to delete are logged and left out of the
+        result.
+
+        Args:
+            keys (Iterable[str]): The S3 paths of the files to be deleted.
+
+        Returns:
+            List[str]: The S3 paths that were deleted.
+
+        Raises:
+            FileSystemError: If a DeleteObjects request fails.
+        """
+        from botocore.exceptions import ClientError
+
+        deleted = []
+        keys = iter(keys)
         try:
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=file_path)
-            logger.info(f"Successfully deleted file from S3: {file_path}")
-            return True
+            for batch in iter(lambda: list(itertools.islice(keys, DELETE_BATCH_SIZE)), []):
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+                failed = set()
+                for error in response.get('Errors', []):
+                    failed.add(error['Key'])
+                    logger.error(f"Error deleting file from S3: {error['Key']}. "
+                                 f"Error: {error.get('Code')} {error.get('Message')}")
+                deleted.extend(key for key in batch if key not in failed)
         except ClientError as e:
-            error_message = f"Error deleting file from S3: {str(e)}"
+            error_message = f"Error deleting files from S3: {str(e)}"
             logger.error(error_message)
             raise FileSystemError(error_message)
 
+        logger.info(f"Deleted {len(deleted)} files from S3")
+        return deleted
+
+    @log_decorator(level="INFO")
+    def delete_prefix(self, prefix: str) -> List[str]:
+        """
+        Deletes every audio file under an S3 prefix.
+
+        Listed pages are streamed straight into bulk deletes, so the full key
+        list is never held in memory.
+
+        Args:
+            prefix (str): The S3 prefix to clear.
+
+        Returns:
+            List[str]: The S3 paths that were deleted.
+
+        Raises:
+            FileSystemError: If listing or deleting fails.
+        """
+        return self.delete_audio_files(self.iter_audio_files(prefix))
+
     @log_decorator(level="INFO")
     def list_audio_files(self, prefix: str) -> List[str]:
         """
@@ -125,16 +466,53 @@ class AWSService:
         Raises:
             FileSystemError: If there's an error during the listing process.
         """
+        file_paths = list(self.iter_audio_files(prefix))
+        logger.info(f"Successfully listed files from S3 prefix: {prefix}")
+        return file_paths
+
+    def iter_audio_files(self, prefix: str) -> Iterator[str]:
+        """
+        Yields every audio file in a specific S3 prefix, one listing page at a time.
+
+        Pages are fetched through the list_objects_v2 paginator, so prefixes
+        with more than 1000 objects are listed completely and only one page is
+        held in memory at a time.
+
+        Args:
+            prefix (str): The S3 prefix to list objects from.
+
+        Yields:
+            str: Path of each file.
+
+        Raises:
+            FileSystemError: If there's an error during the listing process.
+        """
+        from botocore.exceptions import ClientError
+
+        paginator = self.s3_client.get_paginator('list_objects_v2')
         try:
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix)
-            file_paths = [obj['Key'] for obj in response.get('Contents', [])]
-            logger.info(f"Successfully listed files from S3 prefix: {prefix}")
-            return file_paths
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix,
+                                           PaginationConfig={'PageSize': 1000}):
+                for obj in page.get('Contents', ()):
+                    yield obj['Key']
         except ClientError as e:
             error_message = f"Error listing files from S3: {str(e)}"
             logger.error(error_message)
             raise FileSystemError(error_message)
 
+@functools.lru_cache(maxsize=1)
+def get_aws_service() -> AWSService:
+    """
+    Returns the process-wide AWSService, creating it on first use.
+
+    The service is built lazily so importing this module does not create an
+    S3 client or load boto3.
+
+    Returns:
+        AWSService: The shared AWS service instance.
+    """
+    return AWSService()
+
 def generate_s3_path(language: str, intent: str, variation: str, voice_id: str) -> str:
     """
     Generates a standardized S3 path for audio files.
@@ -151,16 +529,12 @@ def generate_s3_path(language: str, intent: str, variation: str, voice_id: str)
     Raises:
         ValueError: If any of the input parameters are invalid.
     """
-    if not all([language, intent, variation, voice_id]):
+    if not (language and intent and variation and voice_id):
         raise ValueError("All parameters (language, intent, variation, voice_id) must be non-empty strings.")
 
-    folder_structure = APP_CONFIG.aws_config['s3']['folder_structure']
-    s3_path = f"{folder_structure['language'].format(language=language)}/" \
-              f"{folder_structure['intent'].format(intent=intent)}/" \
-              f"{folder_structure['variation'].format(phrase_variation=variation)}/" \
-              f"{voice_id}.wav"
-    
-    return s3_path
-
-# Initialize the AWSService
-aws_service = AWSService()
\ No newline at end of file
+    return _S3_PATH_TEMPLATE.format_map({
+        'language': language,
+        'intent': intent,
+        'phrase_variation': variation,
+        'voice_id': voice_id
+    })
@@ -0,0 +1,62 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Default maximum number of items in flight inside a single pipeline stage
+DEFAULT_STAGE_WINDOW: int = 64
+
+async def map_unordered(func: Callable[[T], Awaitable[Optional[R]]], items: AsyncIterator[T],
+                        window: int = DEFAULT_STAGE_WINDOW) -> AsyncIterator[R]:
+    """
+    Applies a coroutine function to a stream of items with bounded concurrency.
+
+    At most `window` items are in flight at any time, so upstream stages are only
+    pulled when there is room and memory stays proportional to the window rather
+    than the size of the stream. Results are yielded in completion order; None
+    results (failed items) are dropped.
+
+    Requirements addressed:
+    - Scalable Data Management (Technical Specification/1.1 SYSTEM OBJECTIVES/3)
+
+    Args:
+        func (Callable[[T], Awaitable[Optional[R]]]): Coroutine function applied to each item.
+        items (AsyncIterator[T]): The input stream.
+        window (int): Maximum number of items processed concurrently.
+
+    Yields:
+        R: Results of func in completion order.
+    """
+    pending = set()
+    async for item in items:
+        pending.add(asyncio.ensure_future(func(item)))
+        if len(pending) >= window:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result is not None:
+                    yield result
+
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            result = task.result()
+            if result is not None:
+                yield result
+
+async def count_items(items: AsyncIterator[T], counter: Dict[str, int], key: str) -> AsyncIterator[T]:
+    """
+    Passes a stream through unchanged while counting its items.
+
+    Args:
+        items (AsyncIterator[T]): The input stream.
+        counter (Dict[str, int]): Mapping holding the running counters.
+        key (str): Counter entry incremented for every item.
+
+    Yields:
+        T: The items of the input stream.
+    """
+    async for item in items:
+        counter[key] += 1
+        yield item
@@ -1,19 +1,50 @@
-import subprocess
+import io
 import os
-from typing import Tuple, Dict, Any
+import functools
+import contextlib
+import subprocess
+import concurrent.futures
+from typing import BinaryIO, Iterator, List, Tuple, Dict, Any, Union
 from .logger import logger, log_decorator
 from .error_handler import FileSystemError, ValidationError
 
+# PyAV links FFmpeg's libraries in-process; without it every call spawns the FFmpeg CLI
+try:
+    import av
+except ImportError:
+    av = None
+
+# orjson parses ffprobe's JSON output several times faster than the json module
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Global constants
 SUPPORTED_FORMATS: Tuple[str, ...] = ('m4a', 'wav')
 DEFAULT_SAMPLE_RATE: int = 16000
 DEFAULT_BIT_DEPTH: int = 16
 
+# FFmpeg invocation that only reports errors, so no progress chatter is produced or piped
+_FFMPEG: Tuple[str, ...] = ('ffmpeg', '-hide_banner', '-loglevel', 'error')
+
+# Maximum number of files converted by one FFmpeg process in convert_audio_batch
+FFMPEG_BATCH_SIZE: int = 32
+
+# Encoder and sample format used for each target format
+_CODECS: Dict[str, Tuple[str, str]] = {
+    'wav': ('pcm_s16le', 's16'),
+    'm4a': ('aac', 'fltp')
+}
+
 @log_decorator(level="INFO")
 def convert_audio(input_path: str, output_path: str, target_format: str, sample_rate: int = DEFAULT_SAMPLE_RATE, bit_depth: int = DEFAULT_BIT_DEPTH) -> bool:
     """
     Converts an audio file to the specified format using FFmpeg.
 
+    When PyAV is installed the file is transcoded in-process; the FFmpeg CLI is
+    used otherwise, and for inputs PyAV cannot decode.
+
     Requirements addressed:
     - Audio Format Conversion (Technical Specification/2.1 PROGRAMMING LANGUAGES)
     - Audio Quality Control (Technical Specification/1.1 SYSTEM OBJECTIVES)
@@ -41,9 +72,18 @@ def convert_audio(input_path: str, output_path: str, target_format: str, sample_
         if target_format not in SUPPORTED_FORMATS:
             raise ValidationError(f"Unsupported target format: {target_format}")
         
+        if av is not None:
+            try:
+                _transcode(input_path, output_path, target_format, 'wav' if target_format == 'wav' else 'ipod',
+                           sample_rate, bit_depth)
+                logger.info(f"Audio conversion successful: {input_path} -> {output_path}")
+                return True
+            except (av.error.FFmpegError, IndexError) as e:
+                logger.warning(f"In-process conversion failed, falling back to the FFmpeg CLI: {str(e)}")
+
         # Construct FFmpeg command
         ffmpeg_command = [
-            'ffmpeg',
+            *_FFMPEG,
             '-i', input_path,
             '-ar', str(sample_rate),
             '-acodec', 'pcm_s16le' if target_format == 'wav' else 'aac',
@@ -53,10 +93,10 @@ def convert_audio(input_path: str, output_path: str, target_format: str, sample_
         ]
         
         # Execute FFmpeg command
-        result = subprocess.run(ffmpeg_command, capture_output=True, text=True)
+        result = subprocess.run(ffmpeg_command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         
         if result.returncode != 0:
-            logger.error(f"FFmpeg conversion failed: {result.stderr}")
+            logger.error(f"FFmpeg conversion failed: {result.stderr.decode(errors='replace')}")
             return False
         
         logger.info(f"Audio conversion successful: {input_path} -> {output_path}")
@@ -69,6 +109,241 @@ def convert_audio(input_path: str, output_path: str, target_format: str, sample_
         logger.error(f"Unexpected error during audio conversion: {str(e)}")
         return False
 
+def convert_audio_buffer(audio_data: Union[bytes, bytearray, memoryview], target_format: str,
+                         sample_rate: int = DEFAULT_SAMPLE_RATE, bit_depth: int = DEFAULT_BIT_DEPTH) -> bytes:
+    """
+    Converts in-memory audio to the specified format with FFmpeg.
+
+    With PyAV installed the buffer is transcoded in-process; otherwise it is
+    handed to the FFmpeg CLI's stdin as is and the converted audio is read back
+    from its stdout. Either way no temporary files are written. Any
+    bytes-like object is accepted, which lets callers pass memoryview slices
+    without copying them first. The function is left undecorated so that it
+    can be pickled into worker processes.
+
+    Requirements addressed:
+    - Audio Format Conversion (Technical Specification/2.1 PROGRAMMING LANGUAGES)
+
+    Args:
+        audio_data (Union[bytes, bytearray, memoryview]): The audio to convert.
+        target_format (str): The desired output format (e.g., 'wav', 'm4a').
+        sample_rate (int): The desired sample rate for the output audio.
+        bit_depth (int): The desired bit depth for the output audio.
+
+    Returns:
+        bytes: The converted audio.
+
+    Raises:
+        ValidationError: If the target format is not supported.
+        FileSystemError: If FFmpeg fails to convert the audio.
+    """
+    if target_format not in SUPPORTED_FORMATS:
+        raise ValidationError(f"Unsupported target format: {target_format}")
+
+    container_format = 'wav' if target_format == 'wav' else 'adts'
+    if av is not None:
+        try:
+            output = io.BytesIO()
+            _transcode(io.BytesIO(audio_data), output, target_format, container_format, sample_rate, bit_depth)
+            return output.getvalue()
+        except (av.error.FFmpegError, IndexError) as e:
+            logger.warning(f"In-process conversion failed, falling back to the FFmpeg CLI: {str(e)}")
+
+    ffmpeg_command = [
+        *_FFMPEG,
+        '-i', 'pipe:0',
+        '-ar', str(sample_rate),
+        '-acodec', 'pcm_s16le' if target_format == 'wav' else 'aac',
+        '-b:a', f'{bit_depth}k',
+        # m4a needs a seekable output, so it is streamed as ADTS instead
+        '-f', container_format,
+        'pipe:1'
+    ]
+
+    result = subprocess.run(ffmpeg_command, input=audio_data, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise FileSystemError(f"FFmpeg conversion failed: {result.stderr.decode(errors='replace')}")
+
+    return result.stdout
+
+@contextlib.contextmanager
+def convert_audio_stream(input_path: str, target_format: str, sample_rate: int = DEFAULT_SAMPLE_RATE,
+                         bit_depth: int = DEFAULT_BIT_DEPTH) -> Iterator[BinaryIO]:
+    """
+    Converts an audio file with FFmpeg and exposes the output as a readable stream.
+
+    FFmpeg writes the converted audio to its stdout, which is yielded as is, so
+    a consumer such as AWSService.upload_audio_file can send it on while it is
+    produced without the whole file being held in memory. On exit the process
+    is waited for; if the block raised, it is killed instead.
+
+    Requirements addressed:
+    - Audio Format Conversion (Technical Specification/2.1 PROGRAMMING LANGUAGES)
+
+    Args:
+        input_path (str): Path to the input audio file.
+        target_format (str): The desired output format (e.g., 'wav', 'm4a').
+        sample_rate (int): The desired sample rate for the output audio.
+        bit_depth (int): The desired bit depth for the output audio.
+
+    Yields:
+        BinaryIO: FFmpeg's stdout, carrying the converted audio.
+
+    Raises:
+        FileSystemError: If the input file does not exist or FFmpeg fails.
+        ValidationError: If the target format is not supported.
+    """
+    if not os.path.exists(input_path):
+        raise FileSystemError(f"Input file does not exist: {input_path}")
+    if target_format not in SUPPORTED_FORMATS:
+        raise ValidationError(f"Unsupported target format: {target_format}")
+
+    ffmpeg_command = [
+        *_FFMPEG,
+        '-i', input_path,
+        '-ar', str(sample_rate),
+        '-acodec', _CODECS[target_format][0],
+        '-b:a', f'{bit_depth}k',
+        # m4a needs a seekable output, so it is streamed as ADTS instead
+        '-f', 'wav' if target_format == 'wav' else 'adts',
+        'pipe:1'
+    ]
+
+    process = subprocess.Popen(ffmpeg_command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+    try:
+        yield process.stdout
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        process.stdout.close()
+
+    stderr = process.stderr.read()
+    process.stderr.close()
+    if process.wait() != 0:
+        raise FileSystemError(f"FFmpeg conversion failed: {stderr.decode(errors='replace')}")
+
+@log_decorator(level="INFO")
+def convert_audio_batch(items: List[Tuple[str, str]], target_format: str, sample_rate: int = DEFAULT_SAMPLE_RATE,
+                        bit_depth: int = DEFAULT_BIT_DEPTH) -> List[bool]:
+    """
+    Converts many audio files to the specified format with few FFmpeg processes.
+
+    Without PyAV, files are grouped FFMPEG_BATCH_SIZE at a time into a single
+    FFmpeg invocation with one input and one mapped output per file, so process
+    startup and codec initialization are paid once per group. Groups run in
+    parallel, one per CPU. If a group fails, its files are converted one by
+    one to find out which succeeded. With PyAV installed, each file is simply
+    converted in-process.
+
+    Requirements addressed:
+    - Audio Format Conversion (Technical Specification/2.1 PROGRAMMING LANGUAGES)
+
+    Args:
+        items (List[Tuple[str, str]]): Pairs of input path and output path.
+        target_format (str): The desired output format (e.g., 'wav', 'm4a').
+        sample_rate (int): The desired sample rate for the output audio.
+        bit_depth (int): The desired bit depth for the output audio.
+
+    Returns:
+        List[bool]: Conversion success of each item, in input order.
+
+    Raises:
+        ValidationError: If the target format is not supported.
+    """
+    if target_format not in SUPPORTED_FORMATS:
+        raise ValidationError(f"Unsupported target format: {target_format}")
+
+    def convert_group(group: List[Tuple[str, str]]) -> List[bool]:
+        if av is None and len(group) > 1 and _run_ffmpeg_batch(group, target_format, sample_rate, bit_depth):
+            return [True] * len(group)
+        results = []
+        for input_path, output_path in group:
+            try:
+                results.append(convert_audio(input_path, output_path, target_format, sample_rate, bit_depth))
+            except FileSystemError:
+                results.append(False)
+        return results
+
+    groups = [items[i:i + FFMPEG_BATCH_SIZE] for i in range(0, len(items), FFMPEG_BATCH_SIZE)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = [result for group_results in executor.map(convert_group, groups) for result in group_results]
+
+    logger.info(f"Converted {sum(results)} of {len(items)} audio files")
+    return results
+
+def _run_ffmpeg_batch(items: List[Tuple[str, str]], target_format: str, sample_rate: int, bit_depth: int) -> bool:
+    """
+    Converts a group of audio files with a single FFmpeg process.
+
+    Args:
+        items (List[Tuple[str, str]]): Pairs of input path and output path.
+        target_format (str): The desired output format (e.g., 'wav', 'm4a').
+        sample_rate (int): The desired sample rate for the output audio.
+        bit_depth (int): The desired bit depth for the output audio.
+
+    Returns:
+        bool: True if every file was converted, False otherwise.
+    """
+    ffmpeg_command = [*_FFMPEG, '-y', '-threads', '0']
+    for input_path, _ in items:
+        ffmpeg_command.extend(['-i', input_path])
+    for index, (_, output_path) in enumerate(items):
+        ffmpeg_command.extend([
+            '-map', f'{index}:a',
+            '-ar', str(sample_rate),
+            '-acodec', _CODECS[target_format][0],
+            '-b:a', f'{bit_depth}k',
+            output_path
+        ])
+
+    result = subprocess.run(ffmpeg_command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        logger.warning(f"Batched FFmpeg conversion failed, converting files individually: "
+                       f"{result.stderr.decode(errors='replace')}")
+        return False
+    return True
+
+def _transcode(source: Union[str, BinaryIO], target: Union[str, BinaryIO], target_format: str,
+               container_format: str, sample_rate: int, bit_depth: int) -> None:
+    """
+    Transcodes the first audio stream of a source into a target with PyAV.
+
+    Frames are resampled to the target rate and the encoder's sample format,
+    keeping the source channel layout like the FFmpeg CLI does. bit_depth sets
+    the encoder bit rate in kbps, as '-b:a' does on the CLI path.
+
+    Args:
+        source (Union[str, BinaryIO]): Input file path or file object.
+        target (Union[str, BinaryIO]): Output file path or file object.
+        target_format (str): The desired output format (e.g., 'wav', 'm4a').
+        container_format (str): FFmpeg muxer to write the output with.
+        sample_rate (int): The desired sample rate for the output audio.
+        bit_depth (int): The desired bit depth for the output audio.
+
+    Raises:
+        av.error.FFmpegError: If decoding or encoding fails.
+        IndexError: If the source has no audio stream.
+    """
+    codec, sample_format = _CODECS[target_format]
+    with av.open(source) as input_container, av.open(target, 'w', format=container_format) as output_container:
+        input_stream = input_container.streams.audio[0]
+        layout = input_stream.codec_context.layout.name
+        output_stream = output_container.add_stream(codec, rate=sample_rate)
+        output_stream.codec_context.layout = layout
+        output_stream.codec_context.format = sample_format
+        output_stream.bit_rate = bit_depth * 1000
+        resampler = av.AudioResampler(format=sample_format, layout=layout, rate=sample_rate)
+
+        for frame in input_container.decode(input_stream):
+            for resampled in resampler.resample(frame):
+                output_container.mux(output_stream.encode(resampled))
+        for resampled in resampler.resample(None):
+            output_container.mux(output_stream.encode(resampled))
+        output_container.mux(output_stream.encode(None))
+
 @log_decorator(level="DEBUG")
 def validate_audio_file(file_path: str) -> bool:
     """
@@ -123,6 +398,11 @@ def get_audio_metadata(file_path: str) -> Dict[str, Any]:
     """
     Retrieves metadata from an audio file using FFmpeg.
 
+    With PyAV installed the container header is parsed in-process; otherwise
+    ffprobe is run and its JSON output parsed. Results are cached by path,
+    modification time and size, so validating an unchanged file again costs
+    a single stat call.
+
     Args:
         file_path (str): Path to the audio file.
 
@@ -133,50 +413,124 @@ def get_audio_metadata(file_path: str) -> Dict[str, Any]:
         FileSystemError: If there are issues with the file path.
     """
     try:
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             raise FileSystemError(f"File does not exist: {file_path}")
-        
-        # Construct FFmpeg command to extract metadata
-        ffprobe_command = [
-            'ffprobe',
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            file_path
-        ]
-        
-        # Execute FFprobe command
-        result = subprocess.run(ffprobe_command, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            logger.error(f"FFprobe metadata extraction failed: {result.stderr}")
-            return {}
-        
-        # Parse FFprobe output
-        metadata = subprocess.loads(result.stdout)
-        
-        # Extract relevant information
-        audio_stream = next((stream for stream in metadata['streams'] if stream['codec_type'] == 'audio'), None)
-        if not audio_stream:
-            logger.warning(f"No audio stream found in file: {file_path}")
-            return {}
-        
-        return {
-            'sample_rate': audio_stream.get('sample_rate'),
-            'bit_depth': audio_stream.get('bits_per_sample'),
-            'codec': audio_stream.get('codec_name'),
-            'duration': float(metadata['format'].get('duration', 0)),
-            'bitrate': int(metadata['format'].get('bit_rate', 0)) // 1000  # Convert to kbps
-        }
-    
+
+        # Copy so callers cannot modify the cached entry
+        return dict(_get_audio_metadata_cached(file_path, stat.st_mtime_ns, stat.st_size))
+
     except FileSystemError as e:
         logger.error(f"Error getting audio metadata: {str(e)}")
         raise
+    except subprocess.CalledProcessError as e:
+        logger.error(f"FFprobe metadata extraction failed: {e.stderr.decode(errors='replace')}")
+        return {}
     except Exception as e:
         logger.error(f"Unexpected error getting audio metadata: {str(e)}")
         return {}
 
+@functools.lru_cache(maxsize=4096)
+def _get_audio_metadata_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Extracts audio metadata for a specific version of a file.
+
+    mtime_ns and size are only part of the cache key, so a modified file is
+    read again. Failures raise and are therefore never cached.
+
+    Args:
+        file_path (str): Path to the audio file.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        Dict[str, Any]: Dictionary containing audio metadata.
+
+    Raises:
+        subprocess.CalledProcessError: If ffprobe fails.
+    """
+    if av is not None:
+        return _read_metadata(file_path)
+
+    metadata = _run_ffprobe(file_path)
+
+    # Extract relevant information
+    audio_stream = next((stream for stream in metadata['streams'] if stream['codec_type'] == 'audio'), None)
+    if not audio_stream:
+        logger.warning(f"No audio stream found in file: {file_path}")
+        return {}
+
+    return {
+        'sample_rate': audio_stream.get('sample_rate'),
+        'bit_depth': audio_stream.get('bits_per_sample'),
+        'codec': audio_stream.get('codec_name'),
+        'duration': float(metadata['format'].get('duration', 0)),
+        'bitrate': int(metadata['format'].get('bit_rate', 0)) // 1000  # Convert to kbps
+    }
+
+def _run_ffprobe(file_path: str) -> Dict[str, Any]:
+    """
+    Runs ffprobe on a file and returns its parsed JSON report.
+
+    Args:
+        file_path (str): Path to the audio file.
+
+    Returns:
+        Dict[str, Any]: The ffprobe report with its 'streams' and 'format' sections.
+
+    Raises:
+        subprocess.CalledProcessError: If ffprobe fails.
+    """
+    ffprobe_command = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-print_format', 'json',
+        '-show_format',
+        '-show_streams',
+        file_path
+    ]
+
+    # The output is parsed as raw bytes without decoding it first
+    result = subprocess.run(ffprobe_command, capture_output=True)
+
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, ffprobe_command, result.stdout, result.stderr)
+
+    return _json_loads(result.stdout)
+
+def _read_metadata(file_path: str) -> Dict[str, Any]:
+    """
+    Reads audio metadata with PyAV, matching the fields get_audio_metadata reports.
+
+    Values follow ffprobe's semantics: the sample rate is a string and the bit
+    depth is the coded bits per sample, which is 0 for compressed codecs.
+
+    Args:
+        file_path (str): Path to the audio file.
+
+    Returns:
+        Dict[str, Any]: Dictionary containing audio metadata, or an empty
+        dictionary if the file has no audio stream.
+    """
+    with av.open(file_path) as container:
+        if not container.streams.audio:
+            logger.warning(f"No audio stream found in file: {file_path}")
+            return {}
+        codec_context = container.streams.audio[0].codec_context
+        # Not every PyAV release exposes bits_per_coded_sample on audio streams;
+        # without it, only PCM codecs have a bit depth, as in ffprobe's report
+        bit_depth = getattr(codec_context, 'bits_per_coded_sample', None)
+        if bit_depth is None:
+            bit_depth = codec_context.format.bits if codec_context.name.startswith('pcm_') else 0
+        return {
+            'sample_rate': str(codec_context.sample_rate),
+            'bit_depth': bit_depth,
+            'codec': codec_context.name,
+            'duration': container.duration / av.time_base if container.duration else 0.0,
+            'bitrate': (container.bit_rate or 0) // 1000  # Convert to kbps
+        }
+
 @log_decorator(level="INFO")
 def normalize_audio(input_path: str, output_path: str, target_db: float = -3.0) -> bool:
     """
@@ -203,7 +557,7 @@ def normalize_audio(input_path: str, output_path: str, target_db: float = -3.0)
         
         # Construct FFmpeg command for normalization
         ffmpeg_command = [
-            'ffmpeg',
+            *_FFMPEG,
             '-i', input_path,
             '-filter:a', f'loudnorm=I={target_db}:TP=-1.5:LRA=11',
             '-y',  # Overwrite output file if it exists
@@ -211,10 +565,10 @@ def normalize_audio(input_path: str, output_path: str, target_db: float = -3.0)
         ]
         
         # Execute FFmpeg command
-        result = subprocess.run(ffmpeg_command, capture_output=True, text=True)
+        result = subprocess.run(ffmpeg_command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         
         if result.returncode != 0:
-            logger.error(f"FFmpeg normalization failed: {result.stderr}")
+            logger.error(f"FFmpeg normalization failed: {result.stderr.decode(errors='replace')}")
             return False
         
         logger.info(f"Audio normalization successful: {input_path} -> {output_path}")
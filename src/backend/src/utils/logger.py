@@ -1,9 +1,23 @@
+import time
 import logging
-import json
-from datetime import datetime
-from typing import Dict, Any
+import threading
+from logging.handlers import QueueHandler
+from typing import Dict, Any, Optional
 
-from ..config.logging_config import LoggingConfig
+from ..config.logging_config import LoggingConfig, start_queue_listener
+
+# orjson serializes log records several times faster than the json module
+try:
+    import orjson
+
+    def _dumps(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data).decode()
+except ImportError:
+    from json import dumps as _dumps
+
+# Queued handler for the application log file, shared by every logger set up here
+_FILE_QUEUE_HANDLER: Optional[QueueHandler] = None
+_FILE_QUEUE_HANDLER_LOCK = threading.Lock()
 
 class CustomFormatter(logging.Formatter):
     """
@@ -44,19 +58,36 @@ class CustomFormatter(logging.Formatter):
         }
 
         if self.include_timestamp:
-            log_data["timestamp"] = datetime.utcnow().isoformat()
+            log_data["timestamp"] = self._timestamp(record.created)
 
         if hasattr(record, 'extra'):
             log_data.update(record.extra)
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+    @staticmethod
+    def _timestamp(created: float) -> str:
+        """
+        Renders a record creation time as an ISO 8601 UTC timestamp.
+
+        The record's own creation time is formatted with time.strftime, which is
+        cheaper than building a datetime and keeps no state between records.
 
-logger: logging.Logger = logging.getLogger(__name__)
+        Args:
+            created (float): Record creation time in seconds since the epoch.
+
+        Returns:
+            str: Timestamp such as 2023-05-20T12:00:00.123456.
+        """
+        seconds, fraction = divmod(created, 1)
+        return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{int(fraction * 1000000):06d}"
 
 def setup_logger(name: str, level: str) -> logging.Logger:
     """
     Initializes and configures a logger instance with the specified name and level.
 
+    Calling it again for the same name only updates the level.
+
     Args:
         name (str): The name of the logger.
         level (str): The logging level (e.g., "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL").
@@ -71,28 +102,44 @@ def setup_logger(name: str, level: str) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level.upper())
 
+    # Handlers are attached once; repeated setup or module reloads must not duplicate them
+    if logger.handlers:
+        return logger
+
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG)
-
-    # Create file handler
-    file_handler = logging.FileHandler(LoggingConfig.LOG_FILE_PATH)
-    file_handler.setLevel(logging.INFO)
-
-    # Create formatters
-    console_formatter = CustomFormatter(include_timestamp=False)
-    file_formatter = CustomFormatter(include_timestamp=True)
-
-    # Set formatters for handlers
-    console_handler.setFormatter(console_formatter)
-    file_handler.setFormatter(file_formatter)
+    console_handler.setFormatter(CustomFormatter(include_timestamp=False))
 
     # Add handlers to logger
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(_get_file_queue_handler())
 
     return logger
 
+def _get_file_queue_handler() -> QueueHandler:
+    """
+    Returns the queued handler for the application log file, creating it on first use.
+
+    All loggers share one file handler and one listener thread, so the file has
+    a single writer however many loggers are set up. Records are written as they
+    arrive rather than held back until a buffer fills.
+
+    Returns:
+        QueueHandler: Handler that hands records to the file listener.
+    """
+    global _FILE_QUEUE_HANDLER
+    with _FILE_QUEUE_HANDLER_LOCK:
+        if _FILE_QUEUE_HANDLER is None:
+            # The file is opened on the first write
+            file_handler = logging.FileHandler(LoggingConfig.LOG_FILE_PATH, delay=True)
+            file_handler.setLevel(logging.INFO)
+            file_handler.setFormatter(CustomFormatter(include_timestamp=True))
+
+            _FILE_QUEUE_HANDLER = start_queue_listener(file_handler)
+            _FILE_QUEUE_HANDLER.setLevel(logging.INFO)
+    return _FILE_QUEUE_HANDLER
+
 def log_decorator(level: str):
     """
     A decorator function to automatically log function entry and exit.
@@ -107,19 +154,26 @@ def log_decorator(level: str):
     - Logging Standards (Technical Specification/3. SYSTEM ARCHITECTURE/3.6 Component Details)
     - Security Monitoring (Technical Specification/6. SECURITY CONSIDERATIONS/6.3.1 Operational Security)
     """
+    # Resolved once here rather than on every call of the decorated function
+    numeric_level = getattr(logging, level.upper())
+
     def decorator(func):
+        func_name = func.__name__
+
         def wrapper(*args, **kwargs):
-            func_name = func.__name__
-            logger.log(getattr(logging, level.upper()), f"Entering {func_name}")
+            enabled = logger.isEnabledFor(numeric_level)
+            if enabled:
+                logger.log(numeric_level, "Entering %s", func_name)
             try:
                 result = func(*args, **kwargs)
-                logger.log(getattr(logging, level.upper()), f"Exiting {func_name}")
-                return result
             except Exception as e:
-                logger.exception(f"Exception in {func_name}: {str(e)}")
+                logger.exception("Exception in %s: %s", func_name, e)
                 raise
+            if enabled:
+                logger.log(numeric_level, "Exiting %s", func_name)
+            return result
         return wrapper
     return decorator
 
 # Initialize the global logger
-logger = setup_logger(__name__, LoggingConfig.DEFAULT_LOG_LEVEL)
\ No newline at end of file
+logger: logging.Logger = setup_logger(__name__, LoggingConfig.DEFAULT_LOG_LEVEL)
\ No newline at end of file
@@ -0,0 +1,56 @@
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# Size of the HTTP connection pool of each shared S3 client; large enough for the
+# concurrent transfers of FileManager and AWSService to each find a warm connection
+S3_MAX_POOL_CONNECTIONS: int = max(64, (os.cpu_count() or 1) * 4)
+
+# Retry policy of the shared S3 clients
+S3_RETRIES: Dict[str, Any] = {'max_attempts': 5, 'mode': 'adaptive'}
+
+# S3 clients shared by every component of the process, by (access key, secret key, region)
+_S3_CLIENTS: Dict[Tuple[Optional[str], Optional[str], Optional[str]], Any] = {}
+_S3_CLIENTS_LOCK = threading.Lock()
+
+def get_s3_client(access_key_id: Optional[str], secret_access_key: Optional[str],
+                  region: Optional[str]) -> Any:
+    """
+    Returns the shared S3 client for a set of credentials, creating it on first use.
+
+    boto3 clients are thread-safe, so one client and its connection pool are
+    reused by FileManager, AWSService and every worker thread. Sessions are
+    not thread-safe, so clients are created under a lock. boto3 is imported
+    here so that importing the calling modules does not load it.
+
+    Requirements addressed:
+    - AWS Integration (Technical Specification/3.6 COMPONENT DETAILS/4)
+
+    Args:
+        access_key_id (Optional[str]): AWS access key ID.
+        secret_access_key (Optional[str]): AWS secret access key.
+        region (Optional[str]): AWS region of the bucket.
+
+    Returns:
+        Any: The shared boto3 S3 client.
+    """
+    key = (access_key_id, secret_access_key, region)
+    with _S3_CLIENTS_LOCK:
+        client = _S3_CLIENTS.get(key)
+        if client is None:
+            import boto3
+            from botocore.config import Config
+
+            client = boto3.session.Session().client(
+                's3',
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                region_name=region,
+                config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    retries=S3_RETRIES,
+                    s3={'addressing_style': 'virtual'}
+                )
+            )
+            _S3_CLIENTS[key] = client
+    return client
@@ -1,24 +1,39 @@
 import os
+import re
 import hashlib
 import secrets
-from typing import Optional
-from cryptography.fernet import Fernet
+import functools
+import threading
+from typing import Optional, TYPE_CHECKING
 from ..config.app_config import AppConfig
-from .logger import logger, log_decorator
+from .logger import logger as base_logger, log_decorator
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+# Logger for this module, a child of the configured application logger
+logger = base_logger.getChild(__name__)
 
 # Constants for API key header and encryption key environment variable
 API_KEY_HEADER: str = 'x-api-key'
 ENCRYPTION_KEY_ENV_VAR: str = 'FEMTOSENSE_ENCRYPTION_KEY'
+# Runs of characters removed by sanitize_input: anything but letters, digits, space, '-', '_' and '.'
+_UNSAFE_CHARS_RE = re.compile(r'[^\w \-.]+')
+# Connection pool size of each SecureAPIClient session
+HTTP_POOL_SIZE: int = 16
 
 class SecurityException(Exception):
     """Custom exception for security-related errors."""
     pass
 
+@functools.lru_cache(maxsize=1)
 @log_decorator("INFO")
 def get_encryption_key() -> bytes:
     """
     Retrieves the encryption key from environment variables, ensuring it exists and is valid.
 
+    The key is read once per process; a missing key raises and is not cached.
+
     Returns:
         bytes: The encryption key
 
@@ -40,6 +55,26 @@ def get_encryption_key() -> bytes:
         logger.error(f"Invalid encryption key: {str(e)}")
         raise SecurityException("Invalid encryption key")
 
+@functools.lru_cache(maxsize=1)
+def _cipher() -> 'Fernet':
+    """
+    Returns the Fernet cipher shared by all encryption and decryption calls.
+
+    Building a Fernet instance parses the key and splits it into its signing
+    and encryption halves, so this is done once instead of per call. The
+    cryptography package is imported here, on first use, rather than when
+    the module is loaded.
+
+    Returns:
+        Fernet: Cipher built from the configured encryption key.
+
+    Raises:
+        SecurityException: If the encryption key is not set or invalid
+    """
+    from cryptography.fernet import Fernet
+
+    return Fernet(get_encryption_key())
+
 @log_decorator("INFO")
 def encrypt_sensitive_data(data: str) -> str:
     """
@@ -58,9 +93,7 @@ def encrypt_sensitive_data(data: str) -> str:
     - Data Security (Technical Specification/6.2 DATA SECURITY)
     """
     try:
-        key = get_encryption_key()
-        cipher_suite = Fernet(key)
-        encrypted_data = cipher_suite.encrypt(data.encode())
+        encrypted_data = _cipher().encrypt(data.encode())
         return encrypted_data.decode()
     except Exception as e:
         logger.error(f"Encryption failed: {str(e)}")
@@ -84,9 +117,7 @@ def decrypt_sensitive_data(encrypted_data: str) -> str:
     - Data Security (Technical Specification/6.2 DATA SECURITY)
     """
     try:
-        key = get_encryption_key()
-        cipher_suite = Fernet(key)
-        decrypted_data = cipher_suite.decrypt(encrypted_data.encode())
+        decrypted_data = _cipher().decrypt(encrypted_data.encode())
         return decrypted_data.decode()
     except Exception as e:
         logger.error(f"Decryption failed: {str(e)}")
@@ -110,9 +141,84 @@ def validate_api_key(api_key: str) -> bool:
     if not stored_hash:
         logger.error("No API key hash found in configuration")
         return False
-    
-    hashed_key = hashlib.sha256(api_key.encode()).hexdigest()
-    return secrets.compare_digest(hashed_key, stored_hash)
+
+    try:
+        stored_digest = _hash_to_digest(stored_hash)
+    except ValueError:
+        logger.error("API key hash in configuration is not a hex encoded digest")
+        return False
+
+    # Compare raw digests: no hex formatting of the computed hash per call
+    return secrets.compare_digest(hashlib.sha256(api_key.encode()).digest(), stored_digest)
+
+@functools.lru_cache(maxsize=8)
+def _hash_to_digest(stored_hash: str) -> bytes:
+    """
+    Decodes a hex encoded hash from the configuration into raw digest bytes.
+
+    The configured hash rarely changes, so each value is decoded only once.
+
+    Args:
+        stored_hash (str): Hex encoded sha256 digest.
+
+    Returns:
+        bytes: The raw digest.
+
+    Raises:
+        ValueError: If stored_hash is not valid hex.
+    """
+    return bytes.fromhex(stored_hash)
+
+class _EntropyPool:
+    """
+    Hands out cryptographically secure random bytes from a buffer filled in bulk.
+
+    One os.urandom call fills the whole buffer, so small requests cost a slice
+    instead of a syscall each. Bytes are never handed out twice, and the
+    buffer is discarded in forked children so they cannot repeat the
+    parent's bytes.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initializes an empty pool.
+
+        Args:
+            size (int): Number of bytes fetched per refill.
+        """
+        self._size = size
+        self._buffer = b''
+        self._offset = 0
+        self._lock = threading.Lock()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def take(self, n: int) -> bytes:
+        """
+        Returns n random bytes, refilling the pool when it runs out.
+
+        Args:
+            n (int): Number of bytes to return.
+
+        Returns:
+            bytes: Random bytes.
+        """
+        with self._lock:
+            if self._offset + n > len(self._buffer):
+                self._buffer = os.urandom(max(self._size, n))
+                self._offset = 0
+            chunk = self._buffer[self._offset:self._offset + n]
+            self._offset += n
+            return chunk
+
+    def _reset(self) -> None:
+        """Drops the buffered bytes and lock state inherited from the parent process."""
+        self._buffer = b''
+        self._offset = 0
+        self._lock = threading.Lock()
+
+# Random bytes for secure filenames, fetched 64KB at a time
+_ENTROPY_POOL = _EntropyPool(65536)
 
 @log_decorator("DEBUG")
 def generate_secure_filename(base_name: str) -> str:
@@ -129,8 +235,7 @@ def generate_secure_filename(base_name: str) -> str:
     - Data Security (Technical Specification/6.2 DATA SECURITY)
     - Security Protocols (Technical Specification/6.3 SECURITY PROTOCOLS)
     """
-    random_suffix = secrets.token_hex(8)
-    return f"{base_name}_{random_suffix}"
+    return f"{base_name}_{_ENTROPY_POOL.take(8).hex()}"
 
 @log_decorator("DEBUG")
 def sanitize_input(input_str: str) -> str:
@@ -146,11 +251,8 @@ def sanitize_input(input_str: str) -> str:
     Requirements addressed:
     - Security Protocols (Technical Specification/6.3 SECURITY PROTOCOLS)
     """
-    # Remove potentially dangerous characters
-    sanitized = ''.join(char for char in input_str if char.isalnum() or char in [' ', '-', '_', '.'])
-    # Escape special characters
-    sanitized = sanitized.replace("'", "''")
-    return sanitized
+    # Remove potentially dangerous characters, then escape special characters
+    return _UNSAFE_CHARS_RE.sub('', input_str).replace("'", "''")
 
 class SecureAPIClient:
     """
@@ -165,16 +267,36 @@ class SecureAPIClient:
         """
         Initializes the SecureAPIClient with an API key
 
+        The key is kept in a mutable buffer that is zeroed when the client is
+        released, rather than Fernet-encrypted and decrypted for every request.
+        Requests go through one pooled session so connections are reused.
+
         Args:
             api_key (str): The API key for authentication
 
         Raises:
             SecurityException: If the API key is invalid
         """
+        import requests  # Import here to avoid circular dependencies
+        from requests.adapters import HTTPAdapter
+
         if not validate_api_key(api_key):
             logger.error("Invalid API key provided")
             raise SecurityException("Invalid API key")
-        self._encrypted_api_key = encrypt_sensitive_data(api_key)
+        self._api_key = bytearray(api_key, 'ascii')
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def __del__(self):
+        """Zeroes the in-memory API key and closes the pooled session."""
+        api_key = getattr(self, '_api_key', None)
+        if api_key is not None:
+            api_key[:] = bytes(len(api_key))
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
 
     @log_decorator("INFO")
     def request(self, endpoint: str, method: str, data: Optional[dict] = None) -> dict:
@@ -199,16 +321,12 @@ class SecureAPIClient:
         import requests  # Import here to avoid circular dependencies
 
         try:
-            api_key = decrypt_sensitive_data(self._encrypted_api_key)
-            headers = {API_KEY_HEADER: api_key}
+            headers = {API_KEY_HEADER: self._api_key.decode('ascii')}
             
-            response = requests.request(method, endpoint, headers=headers, json=data)
+            response = self._session.request(method, endpoint, headers=headers, json=data)
             response.raise_for_status()
             
             return response.json()
         except requests.RequestException as e:
             logger.error(f"API request failed: {str(e)}")
             raise SecurityException(f"API request failed: {str(e)}")
-
-# Initialize the logger for this module
-logger = logger.getChild(__name__)
\ No newline at end of file
@@ -1,8 +1,13 @@
 import pytest
 import os
+import json
 from unittest.mock import patch, MagicMock
+from ..src.utils import audio_converter
 from ..src.utils.audio_converter import (
     convert_audio,
+    convert_audio_buffer,
+    convert_audio_batch,
+    convert_audio_stream,
     validate_audio_file,
     get_audio_metadata,
     normalize_audio,
@@ -17,28 +22,63 @@ TEST_SAMPLE_RATE = 16000
 TEST_BIT_DEPTH = 16
 TEST_TARGET_DB = -3.0
 
+# Parsed ffprobe report returned by the ffprobe stub, built once for the module
+FFPROBE_OUTPUT = {
+    "streams": [{"codec_type": "audio", "sample_rate": "16000", "bits_per_sample": "16"}],
+    "format": {"duration": "10.5", "bit_rate": "128000"}
+}
+# Raw ffprobe stdout for the same report, serialized once for the subprocess mock
+FFPROBE_STDOUT = json.dumps(FFPROBE_OUTPUT).encode()
+
 # Apply markers for better test organization
 pytestmark = [pytest.mark.audio, pytest.mark.utils]
 
-@pytest.fixture
-def mock_audio_file(tmp_path):
+def _option(command, flag):
+    """Returns the value following flag in an FFmpeg argument list."""
+    return command[command.index(flag) + 1]
+
+@pytest.fixture(scope="session")
+def mock_audio_file(tmp_path_factory):
     """
-    Provides a mock audio file for testing.
+    Provides a mock audio file for testing, written once per session.
     """
-    file_path = tmp_path / "test_audio.m4a"
+    file_path = tmp_path_factory.mktemp("audio") / "test_audio.m4a"
     file_path.write_bytes(b"mock audio content")
     return str(file_path)
 
-@pytest.fixture
-def mock_ffmpeg(monkeypatch):
+@pytest.fixture(scope="module")
+def ffmpeg_run():
     """
-    Mocks FFmpeg subprocess calls for testing.
+    Patches subprocess.run with a single mock for the whole module.
     """
     mock_run = MagicMock()
-    mock_run.return_value.returncode = 0
-    mock_run.return_value.stdout = '{"streams": [{"codec_type": "audio", "sample_rate": "16000", "bits_per_sample": "16"}], "format": {"duration": "10.5", "bit_rate": "128000"}}'
-    monkeypatch.setattr("subprocess.run", mock_run)
-    return mock_run
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr("subprocess.run", mock_run)
+        yield mock_run
+
+@pytest.fixture
+def mock_ffmpeg(ffmpeg_run, monkeypatch):
+    """
+    Mocks FFmpeg subprocess calls for testing, resetting the shared mock to a successful run.
+    """
+    ffmpeg_run.reset_mock(return_value=True, side_effect=True)
+    ffmpeg_run.return_value.returncode = 0
+    ffmpeg_run.return_value.stdout = FFPROBE_STDOUT
+    # Exercise the CLI path even where PyAV is installed
+    monkeypatch.setattr(audio_converter, "av", None)
+    audio_converter._get_audio_metadata_cached.cache_clear()
+    return ffmpeg_run
+
+@pytest.fixture
+def mock_ffprobe(monkeypatch):
+    """
+    Replaces ffprobe with a stub returning the parsed FFPROBE_OUTPUT report.
+    """
+    mock_probe = MagicMock(return_value=FFPROBE_OUTPUT)
+    monkeypatch.setattr(audio_converter, "_run_ffprobe", mock_probe)
+    monkeypatch.setattr(audio_converter, "av", None)
+    audio_converter._get_audio_metadata_cached.cache_clear()
+    return mock_probe
 
 def test_convert_audio_success(tmp_path, mock_ffmpeg):
     """
@@ -54,8 +94,62 @@ def test_convert_audio_success(tmp_path, mock_ffmpeg):
     
     assert result is True
     mock_ffmpeg.assert_called_once()
-    assert "-ar 16000" in " ".join(mock_ffmpeg.call_args[0][0])
-    assert "-acodec pcm_s16le" in " ".join(mock_ffmpeg.call_args[0][0])
+    command = mock_ffmpeg.call_args[0][0]
+    assert _option(command, "-ar") == "16000"
+    assert _option(command, "-acodec") == "pcm_s16le"
+
+def test_convert_audio_buffer_pipes_through_ffmpeg(mock_ffmpeg):
+    """
+    Tests in-memory conversion hands the buffer to FFmpeg without copying it.
+    """
+    mock_ffmpeg.return_value.stdout = b"converted audio"
+    audio_data = memoryview(b"mock audio content")
+
+    result = convert_audio_buffer(audio_data, "wav")
+
+    assert result == b"converted audio"
+    assert mock_ffmpeg.call_args[1]["input"] is audio_data
+    assert _option(mock_ffmpeg.call_args[0][0], "-i") == "pipe:0"
+
+def test_convert_audio_stream_yields_ffmpeg_stdout(mock_audio_file, monkeypatch):
+    """
+    Tests that streamed conversion exposes FFmpeg's stdout and checks its exit status.
+    """
+    mock_popen = MagicMock()
+    mock_popen.return_value.stderr.read.return_value = b""
+    mock_popen.return_value.wait.return_value = 0
+    monkeypatch.setattr("subprocess.Popen", mock_popen)
+
+    with convert_audio_stream(mock_audio_file, "wav") as stream:
+        assert stream is mock_popen.return_value.stdout
+
+    command = mock_popen.call_args[0][0]
+    assert _option(command, "-f") == "wav"
+    assert command[-1] == "pipe:1"
+
+    mock_popen.return_value.stderr.read.return_value = b"error"
+    mock_popen.return_value.wait.return_value = 1
+    with pytest.raises(FileSystemError, match="FFmpeg conversion failed"):
+        with convert_audio_stream(mock_audio_file, "wav"):
+            pass
+
+def test_convert_audio_batch_single_process(tmp_path, mock_ffmpeg):
+    """
+    Tests that a batch of files is converted by one FFmpeg invocation.
+    """
+    items = []
+    for i in range(3):
+        input_path = tmp_path / f"input{i}.m4a"
+        input_path.write_bytes(b"mock audio content")
+        items.append((str(input_path), str(tmp_path / f"output{i}.wav")))
+
+    results = convert_audio_batch(items, "wav")
+
+    assert results == [True, True, True]
+    mock_ffmpeg.assert_called_once()
+    command = mock_ffmpeg.call_args[0][0]
+    assert command.count("-i") == 3
+    assert "2:a" in command
 
 def test_convert_audio_invalid_input(tmp_path):
     """
@@ -64,10 +158,8 @@ def test_convert_audio_invalid_input(tmp_path):
     non_existent_file = str(tmp_path / "non_existent.m4a")
     output_path = str(tmp_path / "output.wav")
     
-    with pytest.raises(FileSystemError) as exc_info:
+    with pytest.raises(FileSystemError, match="Input file does not exist"):
         convert_audio(non_existent_file, output_path, "wav")
-    
-    assert "Input file does not exist" in str(exc_info.value)
 
 def test_convert_audio_unsupported_format(mock_audio_file, tmp_path):
     """
@@ -75,12 +167,10 @@ def test_convert_audio_unsupported_format(mock_audio_file, tmp_path):
     """
     output_path = str(tmp_path / "output.mp3")
     
-    with pytest.raises(ValidationError) as exc_info:
+    with pytest.raises(ValidationError, match="Unsupported target format"):
         convert_audio(mock_audio_file, output_path, "mp3")
-    
-    assert "Unsupported target format" in str(exc_info.value)
 
-def test_validate_audio_file(mock_audio_file, mock_ffmpeg):
+def test_validate_audio_file(mock_audio_file, mock_ffprobe):
     """
     Tests audio file validation functionality.
     
@@ -90,7 +180,7 @@ def test_validate_audio_file(mock_audio_file, mock_ffmpeg):
     result = validate_audio_file(mock_audio_file)
     
     assert result is True
-    mock_ffmpeg.assert_called_once()
+    mock_ffprobe.assert_called_once()
 
 def test_validate_audio_file_unsupported_format(tmp_path):
     """
@@ -103,17 +193,20 @@ def test_validate_audio_file_unsupported_format(tmp_path):
     
     assert result is False
 
-def test_validate_audio_file_low_quality(mock_audio_file, mock_ffmpeg):
+def test_validate_audio_file_low_quality(mock_audio_file, mock_ffprobe):
     """
     Tests validation of low-quality audio file.
     """
-    mock_ffmpeg.return_value.stdout = '{"streams": [{"codec_type": "audio", "sample_rate": "8000", "bits_per_sample": "8"}], "format": {}}'
+    mock_ffprobe.return_value = {
+        "streams": [{"codec_type": "audio", "sample_rate": "8000", "bits_per_sample": "8"}],
+        "format": {}
+    }
     
     result = validate_audio_file(mock_audio_file)
     
     assert result is False
 
-def test_get_audio_metadata(mock_audio_file, mock_ffmpeg):
+def test_get_audio_metadata(mock_audio_file, mock_ffprobe):
     """
     Tests extraction of metadata from audio files.
     
@@ -129,16 +222,33 @@ def test_get_audio_metadata(mock_audio_file, mock_ffmpeg):
         'duration': 10.5,
         'bitrate': 128
     }
-    mock_ffmpeg.assert_called_once()
+    mock_ffprobe.assert_called_once_with(mock_audio_file)
+
+def test_get_audio_metadata_cached(mock_audio_file, mock_ffprobe):
+    """
+    Tests that metadata of an unchanged file is only extracted once.
+    """
+    first = get_audio_metadata(mock_audio_file)
+    second = get_audio_metadata(mock_audio_file)
+
+    assert first == second
+    mock_ffprobe.assert_called_once()
+
+def test_run_ffprobe_parses_output(mock_audio_file, mock_ffmpeg):
+    """
+    Tests that the ffprobe runner parses the JSON report from ffprobe's raw output.
+    """
+    report = audio_converter._run_ffprobe(mock_audio_file)
+
+    assert report == FFPROBE_OUTPUT
+    assert mock_ffmpeg.call_args[0][0][0] == "ffprobe"
 
 def test_get_audio_metadata_file_not_found():
     """
     Tests error handling when file is not found for metadata extraction.
     """
-    with pytest.raises(FileSystemError) as exc_info:
+    with pytest.raises(FileSystemError, match="File does not exist"):
         get_audio_metadata("non_existent_file.wav")
-    
-    assert "File does not exist" in str(exc_info.value)
 
 def test_normalize_audio(mock_audio_file, mock_ffmpeg, tmp_path):
     """
@@ -153,7 +263,7 @@ def test_normalize_audio(mock_audio_file, mock_ffmpeg, tmp_path):
     
     assert result is True
     mock_ffmpeg.assert_called_once()
-    assert f"loudnorm=I={TEST_TARGET_DB}" in " ".join(mock_ffmpeg.call_args[0][0])
+    assert _option(mock_ffmpeg.call_args[0][0], "-filter:a").startswith(f"loudnorm=I={TEST_TARGET_DB}:")
 
 def test_normalize_audio_file_not_found(tmp_path):
     """
@@ -162,42 +272,16 @@ def test_normalize_audio_file_not_found(tmp_path):
     non_existent_file = str(tmp_path / "non_existent.wav")
     output_path = str(tmp_path / "normalized.wav")
     
-    with pytest.raises(FileSystemError) as exc_info:
+    with pytest.raises(FileSystemError, match="Input file does not exist"):
         normalize_audio(non_existent_file, output_path)
-    
-    assert "Input file does not exist" in str(exc_info.value)
-
-def test_normalize_audio_ffmpeg_failure(mock_audio_file, mock_ffmpeg, tmp_path):
-    """
-    Tests error handling when FFmpeg fails during normalization.
-    """
-    mock_ffmpeg.return_value.returncode = 1
-    mock_ffmpeg.return_value.stderr = "FFmpeg error"
-    output_path = str(tmp_path / "normalized.wav")
-    
-    result = normalize_audio(mock_audio_file, output_path)
-    
-    assert result is False
 
 # Additional tests to ensure comprehensive coverage
 
-def test_convert_audio_ffmpeg_failure(mock_audio_file, mock_ffmpeg, tmp_path):
-    """
-    Tests error handling when FFmpeg fails during conversion.
-    """
-    mock_ffmpeg.return_value.returncode = 1
-    mock_ffmpeg.return_value.stderr = "FFmpeg error"
-    output_path = str(tmp_path / "output.wav")
-    
-    result = convert_audio(mock_audio_file, output_path, "wav")
-    
-    assert result is False
-
-def test_validate_audio_file_no_audio_stream(mock_audio_file, mock_ffmpeg):
+def test_validate_audio_file_no_audio_stream(mock_audio_file, mock_ffprobe):
     """
     Tests validation when no audio stream is found in the file.
     """
-    mock_ffmpeg.return_value.stdout = '{"streams": [{"codec_type": "video"}], "format": {}}'
+    mock_ffprobe.return_value = {"streams": [{"codec_type": "video"}], "format": {}}
     
     result = validate_audio_file(mock_audio_file)
     
@@ -215,11 +299,11 @@ def test_convert_audio_supported_formats(mock_audio_file, mock_ffmpeg, tmp_path,
     assert result is True
     mock_ffmpeg.assert_called_once()
 
-def test_get_audio_metadata_empty_response(mock_audio_file, mock_ffmpeg):
+def test_get_audio_metadata_empty_response(mock_audio_file, mock_ffprobe):
     """
     Tests handling of empty metadata response from FFmpeg.
     """
-    mock_ffmpeg.return_value.stdout = '{}'
+    mock_ffprobe.return_value = {}
     
     metadata = get_audio_metadata(mock_audio_file)
     
@@ -235,48 +319,48 @@ def test_normalize_audio_custom_target_db(mock_audio_file, mock_ffmpeg, tmp_path
     result = normalize_audio(mock_audio_file, output_path, custom_db)
     
     assert result is True
-    assert f"loudnorm=I={custom_db}" in " ".join(mock_ffmpeg.call_args[0][0])
+    assert _option(mock_ffmpeg.call_args[0][0], "-filter:a").startswith(f"loudnorm=I={custom_db}:")
 
 # Error handling and edge case tests
 
-def test_convert_audio_unexpected_error(mock_audio_file, mock_ffmpeg, tmp_path):
-    """
-    Tests handling of unexpected errors during conversion.
-    """
-    mock_ffmpeg.side_effect = Exception("Unexpected error")
-    output_path = str(tmp_path / "output.wav")
-    
-    result = convert_audio(mock_audio_file, output_path, "wav")
-    
-    assert result is False
+# Calls of each public function on the mock audio file, for the shared failure tests
+_FAILURE_CALLS = {
+    "convert_audio": lambda audio_file, output_path: convert_audio(audio_file, output_path, "wav"),
+    "validate_audio_file": lambda audio_file, output_path: validate_audio_file(audio_file),
+    "get_audio_metadata": lambda audio_file, output_path: get_audio_metadata(audio_file),
+    "normalize_audio": lambda audio_file, output_path: normalize_audio(audio_file, output_path)
+}
 
-def test_validate_audio_file_unexpected_error(mock_audio_file, mock_ffmpeg):
+@pytest.mark.parametrize("name,expected", [
+    ("convert_audio", False),
+    ("normalize_audio", False)
+])
+def test_ffmpeg_failure(mock_audio_file, mock_ffmpeg, name, expected):
     """
-    Tests handling of unexpected errors during validation.
+    Tests error handling when FFmpeg exits with an error.
     """
-    mock_ffmpeg.side_effect = Exception("Unexpected error")
-    
-    result = validate_audio_file(mock_audio_file)
-    
-    assert result is False
+    mock_ffmpeg.return_value.returncode = 1
+    mock_ffmpeg.return_value.stderr = b"FFmpeg error"
+    output_path = os.path.join(os.path.dirname(mock_audio_file), "output.wav")
 
-def test_get_audio_metadata_unexpected_error(mock_audio_file, mock_ffmpeg):
-    """
-    Tests handling of unexpected errors during metadata extraction.
-    """
-    mock_ffmpeg.side_effect = Exception("Unexpected error")
-    
-    metadata = get_audio_metadata(mock_audio_file)
-    
-    assert metadata == {}
+    result = _FAILURE_CALLS[name](mock_audio_file, output_path)
+
+    assert result == expected
 
-def test_normalize_audio_unexpected_error(mock_audio_file, mock_ffmpeg, tmp_path):
+@pytest.mark.parametrize("name,expected", [
+    ("convert_audio", False),
+    ("validate_audio_file", False),
+    ("get_audio_metadata", {}),
+    ("normalize_audio", False)
+])
+def test_unexpected_error(mock_audio_file, mock_ffmpeg, mock_ffprobe, name, expected):
     """
-    Tests handling of unexpected errors during normalization.
+    Tests handling of unexpected errors raised by FFmpeg or ffprobe.
     """
     mock_ffmpeg.side_effect = Exception("Unexpected error")
-    output_path = str(tmp_path / "normalized.wav")
-    
-    result = normalize_audio(mock_audio_file, output_path)
-    
-    assert result is False
\ No newline at end of file
+    mock_ffprobe.side_effect = Exception("Unexpected error")
+    output_path = os.path.join(os.path.dirname(mock_audio_file), "output.wav")
+
+    result = _FAILURE_CALLS[name](mock_audio_file, output_path)
+
+    assert result == expected
@@ -1,27 +1,46 @@
+import io
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 import boto3
+from boto3.exceptions import S3UploadFailedError
 from botocore.exceptions import ClientError
 
+from ..src.services import aws_service as aws_module
+from ..src.utils import s3_client as s3_client_module
 from ..src.services.aws_service import AWSService, generate_s3_path
 from ..src.config.app_config import AppConfig
 from ..src.utils.error_handler import FileSystemError
 
-@pytest.fixture
-def aws_service():
-    """Fixture to create an instance of AWSService for testing."""
+@pytest.fixture(scope="class")
+def mock_boto3_client():
+    """Fixture to patch S3 client creation once for all tests of a class."""
+    s3_client_module._S3_CLIENTS.clear()
+    with patch('boto3.session.Session.client') as mock_client:
+        yield mock_client
+    s3_client_module._S3_CLIENTS.clear()
+
+@pytest.fixture(scope="class")
+def aws_service(mock_boto3_client):
+    """Fixture to create an instance of AWSService shared by the tests of a class."""
     config = AppConfig()
     return AWSService(config)
 
 @pytest.fixture
-def mock_s3_client():
-    """Fixture to mock the S3 client."""
-    with patch('boto3.client') as mock_client:
-        yield mock_client.return_value
-
-def generate_test_audio_data():
-    """Generates mock audio data for testing purposes."""
-    return b'mock audio data'
+def mock_s3_client(aws_service):
+    """Fixture to install a fresh mock S3 client on the shared AWSService for each test."""
+    client = MagicMock()
+    aws_service.s3_client = client
+    return client
+
+# Mock audio data shared by the tests
+TEST_AUDIO_DATA = b'mock audio data'
+# Regional virtual-hosted URL of the default bucket in the default region (us-west-2)
+TEST_URL_PREFIX = "https://femtosense-voice-commands.s3.us-west-2.amazonaws.com/"
+# S3 error raised by failing client calls, built once for all failure tests
+TEST_CLIENT_ERROR = ClientError(
+    {'Error': {'Code': 'TestException', 'Message': 'Test error message'}},
+    'TestOperation'
+)
 
 class TestAWSService:
     """
@@ -37,9 +56,9 @@ class TestAWSService:
         """Tests the successful upload of an audio file to AWS S3."""
         # Arrange
         file_path = "test/path/audio.wav"
-        audio_data = generate_test_audio_data()
+        audio_data = TEST_AUDIO_DATA
         metadata = {"intent": "TEST_INTENT", "language": "en"}
-        expected_url = f"https://{aws_service.bucket_name}.s3.amazonaws.com/{file_path}"
+        expected_url = TEST_URL_PREFIX + file_path
 
         # Act
         result = aws_service.upload_audio_file(file_path, audio_data, metadata)
@@ -54,24 +73,139 @@ class TestAWSService:
         )
         assert result == expected_url
 
+    def test_upload_audio_file_multipart(self, aws_service, mock_s3_client):
+        """Tests that large audio is streamed through the managed multipart transfer."""
+        # Arrange
+        file_path = "test/path/audio.wav"
+        audio_data = b'\0' * aws_module.TRANSFER_MULTIPART_THRESHOLD
+
+        # Act
+        aws_service.upload_audio_file(file_path, audio_data, {})
+
+        # Assert
+        mock_s3_client.put_object.assert_not_called()
+        args, kwargs = mock_s3_client.upload_fileobj.call_args
+        assert args[0].getvalue() == audio_data
+        assert args[1:] == (aws_service.bucket_name, file_path)
+        assert kwargs['Config'] is aws_service._transfer_config
+
+    def test_upload_audio_file_stream(self, aws_service, mock_s3_client):
+        """Tests that a readable stream is handed to the managed transfer without reading it."""
+        # Arrange
+        stream = io.BytesIO(TEST_AUDIO_DATA)
+
+        # Act
+        aws_service.upload_audio_file("test/path/audio.wav", stream, {})
+
+        # Assert
+        mock_s3_client.put_object.assert_not_called()
+        assert mock_s3_client.upload_fileobj.call_args[0][0] is stream
+        assert stream.tell() == 0
+
     def test_upload_audio_file_failure(self, aws_service, mock_s3_client):
         """Tests proper error handling when an upload fails."""
         # Arrange
-        mock_s3_client.put_object.side_effect = ClientError(
-            {'Error': {'Code': 'TestException', 'Message': 'Test error message'}},
-            'PutObject'
-        )
+        mock_s3_client.put_object.side_effect = TEST_CLIENT_ERROR
 
         # Act & Assert
-        with pytest.raises(FileSystemError):
-            aws_service.upload_audio_file("test/path/audio.wav", generate_test_audio_data(), {})
+        with pytest.raises(FileSystemError, match="Error uploading file to S3"):
+            aws_service.upload_audio_file("test/path/audio.wav", TEST_AUDIO_DATA, {})
+
+    def test_bulk_upload(self, aws_service, mock_s3_client):
+        """Tests the concurrent upload of a batch of in-memory audio files."""
+        # Arrange
+        items = [(f"test/path/audio{i}.wav", TEST_AUDIO_DATA, {}) for i in range(3)]
+        mock_s3_client.put_object.side_effect = [None, TEST_CLIENT_ERROR, None]
+
+        # Act
+        result = aws_service.bulk_upload(items)
+
+        # Assert
+        assert mock_s3_client.put_object.call_count == 3
+        assert len(result) == 2
+
+    def test_upload_files(self, aws_service, mock_s3_client, tmp_path):
+        """Tests the concurrent upload of a batch of local audio files."""
+        # Arrange
+        audio_files = []
+        for i in range(3):
+            local_path = tmp_path / f"audio{i}.wav"
+            local_path.write_bytes(TEST_AUDIO_DATA)
+            audio_files.append((str(local_path), f"test/path/audio{i}.wav"))
+
+        # Act
+        result = aws_service.upload_files(audio_files)
+
+        # Assert
+        assert mock_s3_client.upload_file.call_count == 3
+        mock_s3_client.upload_file.assert_any_call(
+            audio_files[0][0],
+            aws_service.bucket_name,
+            "test/path/audio0.wav",
+            ExtraArgs={'ContentType': 'audio/wav'},
+            Config=aws_service._transfer_config
+        )
+        assert sorted(result) == [
+            TEST_URL_PREFIX + f"test/path/audio{i}.wav" for i in range(3)
+        ]
+
+    def test_upload_files_skips_failed_uploads(self, aws_service, mock_s3_client, tmp_path):
+        """Tests that files S3 rejects are logged and left out of the result."""
+        # Arrange
+        audio_files = []
+        for i in range(2):
+            local_path = tmp_path / f"audio{i}.wav"
+            local_path.write_bytes(TEST_AUDIO_DATA)
+            audio_files.append((str(local_path), f"test/path/audio{i}.wav"))
+        mock_s3_client.upload_file.side_effect = [None, S3UploadFailedError("Test error message")]
+
+        # Act
+        result = aws_service.upload_files(audio_files)
+
+        # Assert
+        assert mock_s3_client.upload_file.call_count == 2
+        assert len(result) == 1
+
+    def test_upload_files_copies_cached_objects(self, aws_service, mock_s3_client, tmp_path):
+        """Tests that files already in the cache are copied server-side instead of uploaded."""
+        # Arrange
+        local_path = tmp_path / "audio.wav"
+        local_path.write_bytes(TEST_AUDIO_DATA)
+
+        # Act
+        result = aws_service.upload_files(
+            [(str(local_path), "test/path/audio.wav")],
+            copy_sources={"test/path/audio.wav": "cache/abc.wav"}
+        )
+
+        # Assert
+        mock_s3_client.head_object.assert_called_once_with(Bucket=aws_service.bucket_name, Key="cache/abc.wav")
+        assert mock_s3_client.copy.call_count == 1
+        mock_s3_client.upload_file.assert_not_called()
+        assert result == [TEST_URL_PREFIX + "test/path/audio.wav"]
+
+    def test_copy_audio_file(self, aws_service, mock_s3_client):
+        """Tests that files are copied between buckets server-side."""
+        # Arrange
+
+        # Act
+        result = aws_service.copy_audio_file("old/audio.wav", "new/audio.wav", src_bucket="old-bucket")
+
+        # Assert
+        mock_s3_client.copy.assert_called_once_with(
+            {'Bucket': 'old-bucket', 'Key': "old/audio.wav"},
+            aws_service.bucket_name,
+            "new/audio.wav",
+            Config=aws_service._copy_config
+        )
+        assert result == TEST_URL_PREFIX + "new/audio.wav"
 
     def test_download_audio_file(self, aws_service, mock_s3_client):
         """Tests the successful download of an audio file from AWS S3."""
         # Arrange
         file_path = "test/path/audio.wav"
-        expected_data = generate_test_audio_data()
-        mock_s3_client.get_object.return_value = {'Body': MagicMock(read=lambda: expected_data)}
+        expected_data = TEST_AUDIO_DATA
+        mock_s3_client.get_object.return_value = {'Body': io.BytesIO(expected_data)}
 
         # Act
         result = aws_service.download_audio_file(file_path)
@@ -86,71 +220,83 @@ class TestAWSService:
     def test_download_audio_file_failure(self, aws_service, mock_s3_client):
         """Tests proper error handling when a download fails."""
         # Arrange
-        mock_s3_client.get_object.side_effect = ClientError(
-            {'Error': {'Code': 'TestException', 'Message': 'Test error message'}},
-            'GetObject'
-        )
+        mock_s3_client.get_object.side_effect = TEST_CLIENT_ERROR
 
         # Act & Assert
-        with pytest.raises(FileSystemError):
+        with pytest.raises(FileSystemError, match="Error downloading file from S3"):
             aws_service.download_audio_file("test/path/audio.wav")
 
     def test_delete_audio_file(self, aws_service, mock_s3_client):
         """Tests the successful deletion of an audio file from AWS S3."""
         # Arrange
         file_path = "test/path/audio.wav"
+        mock_s3_client.delete_objects.return_value = {}
 
         # Act
         result = aws_service.delete_audio_file(file_path)
 
         # Assert
-        mock_s3_client.delete_object.assert_called_once_with(
+        mock_s3_client.delete_objects.assert_called_once_with(
             Bucket=aws_service.bucket_name,
-            Key=file_path
+            Delete={'Objects': [{'Key': file_path}], 'Quiet': True}
         )
         assert result is True
 
     def test_delete_audio_file_failure(self, aws_service, mock_s3_client):
         """Tests proper error handling when a deletion fails."""
         # Arrange
-        mock_s3_client.delete_object.side_effect = ClientError(
-            {'Error': {'Code': 'TestException', 'Message': 'Test error message'}},
-            'DeleteObject'
-        )
+        mock_s3_client.delete_objects.side_effect = TEST_CLIENT_ERROR
 
         # Act & Assert
-        with pytest.raises(FileSystemError):
+        with pytest.raises(FileSystemError, match="Error deleting file"):
             aws_service.delete_audio_file("test/path/audio.wav")
 
+    def test_delete_audio_files_batches_keys(self, aws_service, mock_s3_client):
+        """Tests that bulk deletes are chunked and per-key errors are left out of the result."""
+        # Arrange
+        keys = [f"test/path/audio{i}.wav" for i in range(aws_module.DELETE_BATCH_SIZE + 1)]
+        mock_s3_client.delete_objects.side_effect = [
+            {'Errors': [{'Key': keys[0], 'Code': 'AccessDenied', 'Message': 'Access Denied'}]},
+            {}
+        ]
+
+        # Act
+        result = aws_service.delete_audio_files(iter(keys))
+
+        # Assert
+        assert mock_s3_client.delete_objects.call_count == 2
+        assert result == keys[1:]
+
     def test_list_audio_files(self, aws_service, mock_s3_client):
         """Tests the listing of audio files from a specific S3 prefix."""
         # Arrange
         prefix = "test/path/"
-        expected_files = ["test/path/audio1.wav", "test/path/audio2.wav"]
-        mock_s3_client.list_objects_v2.return_value = {
-            'Contents': [{'Key': file} for file in expected_files]
-        }
+        expected_files = ["test/path/audio1.wav", "test/path/audio2.wav", "test/path/audio3.wav"]
+        paginator = mock_s3_client.get_paginator.return_value
+        paginator.paginate.return_value = [
+            {'Contents': [{'Key': file} for file in expected_files[:2]]},
+            {'Contents': [{'Key': expected_files[2]}]}
+        ]
 
         # Act
         result = aws_service.list_audio_files(prefix)
 
         # Assert
-        mock_s3_client.list_objects_v2.assert_called_once_with(
+        mock_s3_client.get_paginator.assert_called_once_with('list_objects_v2')
+        paginator.paginate.assert_called_once_with(
             Bucket=aws_service.bucket_name,
-            Prefix=prefix
+            Prefix=prefix,
+            PaginationConfig={'PageSize': 1000}
         )
         assert result == expected_files
 
     def test_list_audio_files_failure(self, aws_service, mock_s3_client):
         """Tests proper error handling when listing files fails."""
         # Arrange
-        mock_s3_client.list_objects_v2.side_effect = ClientError(
-            {'Error': {'Code': 'TestException', 'Message': 'Test error message'}},
-            'ListObjectsV2'
-        )
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = TEST_CLIENT_ERROR
 
         # Act & Assert
-        with pytest.raises(FileSystemError):
+        with pytest.raises(FileSystemError, match="Error listing files from S3"):
             aws_service.list_audio_files("test/path/")
 
     def test_generate_s3_path(self):
@@ -171,9 +317,21 @@ class TestAWSService:
     def test_generate_s3_path_invalid_input(self):
         """Tests error handling for invalid input in generate_s3_path."""
         # Act & Assert
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="must be non-empty strings"):
             generate_s3_path("", "LIGHTS_ON", "turn-on-the-lights", "en-US-1")
 
+    def test_get_aws_service_is_shared(self, mock_boto3_client):
+        """Tests that get_aws_service builds the service once and reuses it."""
+        aws_module.get_aws_service.cache_clear()
+
+        # Act
+        first = aws_module.get_aws_service()
+        second = aws_module.get_aws_service()
+
+        # Assert
+        assert isinstance(first, AWSService)
+        assert first is second
+
     @pytest.mark.parametrize("config_override", [
         {"aws_config": {"credentials": {"access_key_id": "test_key", "secret_access_key": "test_secret"}}},
         {"aws_config": {"s3": {"region": "us-west-2", "bucket_name": "test-bucket"}}}
@@ -184,15 +342,19 @@ class TestAWSService:
         config = AppConfig()
         config.update(config_override)
 
+        s3_client_module._S3_CLIENTS.clear()
+
         # Act
-        with patch('boto3.client') as mock_boto3_client:
+        with patch('boto3.session.Session.client') as mock_boto3_client:
             aws_service = AWSService(config)
+            AWSService(config)
 
         # Assert
         mock_boto3_client.assert_called_once_with(
             's3',
             aws_access_key_id=config.aws_config['credentials']['access_key_id'],
             aws_secret_access_key=config.aws_config['credentials']['secret_access_key'],
-            region_name=config.aws_config['s3']['region']
+            region_name=config.aws_config['s3']['region'],
+            config=ANY
         )
         assert aws_service.bucket_name == config.aws_config['s3']['bucket_name']
\ No newline at end of file
@@ -6,9 +6,9 @@ from pathlib import Path
 import boto3
 from botocore.exceptions import ClientError
 
+from ..utils import s3_client as s3_client_module
 from ..core.file_manager import FileManager
 from ..config.app_config import AppConfig
-from ..utils.audio_converter import convert_to_wav
 
 # Mock AWS credentials for testing
 os.environ['AWS_ACCESS_KEY_ID'] = 'test_access_key'
@@ -16,8 +16,11 @@ os.environ['AWS_SECRET_ACCESS_KEY'] = 'test_secret_key'
 
 @pytest.fixture
 def mock_s3_client():
-    with patch('boto3.client') as mock_client:
+    # Clients are cached per process, so each test starts without one
+    s3_client_module._S3_CLIENTS.clear()
+    with patch('boto3.session.Session.client') as mock_client:
         yield mock_client.return_value
+    s3_client_module._S3_CLIENTS.clear()
 
 @pytest.fixture
 def sample_audio_data():
@@ -33,11 +36,13 @@ def sample_metadata():
     }
 
 @pytest.fixture
-def file_manager(tmp_path):
+def file_manager(tmp_path, mock_s3_client):
+    # Depends on mock_s3_client so the client FileManager caches is the mock
     config = AppConfig()
     config.set('LOCAL_STORAGE_PATH', str(tmp_path))
     config.set('S3_BUCKET_NAME', 'test-bucket')
-    return FileManager(config)
+    with FileManager(config) as manager:
+        yield manager
 
 class TestFileManager:
 
@@ -50,24 +55,126 @@ class TestFileManager:
         assert isinstance(file_manager.local_base_path, Path)
         assert file_manager.bucket_name == 'test-bucket'
 
+    def test_init_reuses_one_s3_client(self, file_manager, mock_s3_client):
+        """
+        Test that every S3 operation goes through the client created in __init__.
+        Requirement: Scalable Data Management
+        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
+        """
+        mock_s3_client.get_paginator.return_value.paginate.return_value = iter([{}])
+
+        file_manager.get_audio_file('missing.wav', prefer_local=False)
+        file_manager.delete_audio_file('missing.wav')
+        file_manager.list_audio_files('LIGHTS_ON', 'korean')
+
+        assert file_manager.s3_client is mock_s3_client
+        mock_s3_client.get_object.assert_called_once()
+        mock_s3_client.delete_object.assert_called_once()
+
+    def test_s3_client_shared_between_instances(self, file_manager, mock_s3_client):
+        """
+        Test that FileManager instances with the same credentials share one S3 client.
+        Requirement: Scalable Data Management
+        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
+        """
+        other = FileManager(file_manager.config)
+
+        assert other.s3_client is file_manager.s3_client
+        assert len(s3_client_module._S3_CLIENTS) == 1
+
     def test_save_audio_file(self, file_manager, mock_s3_client, sample_audio_data, sample_metadata):
         """
         Test saving an audio file both locally and to S3.
         Requirement: Audio Dataset Creation, Structured Storage
         Location: Technical Specification/1.1 SYSTEM OBJECTIVES/2, Technical Specification/1.1 SYSTEM OBJECTIVES/3
         """
+        file_manager.transfer_manager = MagicMock()
+
         local_path, s3_path = file_manager.save_audio_file(sample_audio_data, sample_metadata)
 
         # Check local file
         assert Path(local_path).exists()
         assert Path(local_path).read_bytes() == sample_audio_data
 
-        # Check S3 upload
-        mock_s3_client.upload_file.assert_called_once()
-        _, kwargs = mock_s3_client.upload_file.call_args
-        assert kwargs['Bucket'] == 'test-bucket'
-        assert kwargs['Key'] == s3_path
-        assert kwargs['ExtraArgs']['Metadata'] == sample_metadata
+        # Check S3 upload is streamed from memory
+        file_manager.transfer_manager.upload.assert_called_once()
+        args, kwargs = file_manager.transfer_manager.upload.call_args
+        assert args[0].getvalue() == sample_audio_data
+        assert args[1:] == ('test-bucket', s3_path)
+        assert kwargs['extra_args'] == {'Metadata': sample_metadata}
+        file_manager.transfer_manager.upload.return_value.result.assert_called_once()
+
+    def test_save_audio_file_without_local_copy(self, file_manager, mock_s3_client, sample_audio_data, sample_metadata):
+        """
+        Test uploading an audio file to S3 without writing it to local storage.
+        Requirement: Scalable Data Management
+        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
+        """
+        file_manager.transfer_manager = MagicMock()
+
+        local_path, s3_path = file_manager.save_audio_file(sample_audio_data, sample_metadata, local_copy=False)
+
+        assert local_path is None
+        assert s3_path == 'korean/LIGHTS_ON/turn_on_lights_voice1.wav'
+        assert not (file_manager.local_base_path / 'korean').exists()
+        file_manager.transfer_manager.upload.assert_called_once()
+
+    def test_save_audio_file_without_upload(self, file_manager, mock_s3_client, sample_audio_data, sample_metadata):
+        """
+        Test writing only the local copy of an audio file that is uploaded by a later stage.
+        Requirement: Scalable Data Management
+        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
+        """
+        file_manager.transfer_manager = MagicMock()
+
+        local_path, s3_path = file_manager.save_audio_file(sample_audio_data, sample_metadata, upload=False)
+
+        assert Path(local_path).read_bytes() == sample_audio_data
+        assert s3_path == 'korean/LIGHTS_ON/turn_on_lights_voice1.wav'
+        file_manager.transfer_manager.upload.assert_not_called()
+
+    def test_save_audio_file_copies_existing_object(self, file_manager, mock_s3_client, sample_audio_data, sample_metadata):
+        """
+        Test that audio already stored in the bucket is copied server-side instead of uploaded.
+        Requirement: Scalable Data Management
+        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
+        """
+        file_manager.transfer_manager = MagicMock()
+
+        _, s3_path = file_manager.save_audio_file(sample_audio_data, sample_metadata, copy_source='cache/abc.wav')
+
+        mock_s3_client.head_object.assert_called_once_with(Bucket='test-bucket', Key='cache/abc.wav')
+        file_manager.transfer_manager.copy.assert_called_once_with(
+            {'Bucket': 'test-bucket', 'Key': 'cache/abc.wav'},
+            'test-bucket',
+            s3_path,
+            extra_args={'Metadata': sample_metadata, 'MetadataDirective': 'REPLACE'}
+        )
+        file_manager.transfer_manager.upload.assert_not_called()
+
+    def test_save_audio_files_batch(self, file_manager, mock_s3_client, sample_audio_data, sample_metadata):
+        """
+        Test that a batch of uploads is submitted before any of them is awaited.
+        Requirement: Scalable Data Management
+        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
+        """
+        file_manager.transfer_manager = MagicMock()
+        second_metadata = dict(sample_metadata, variation='lights_on_please')
+
+        saved_files = file_manager.save_audio_files([
+            (sample_audio_data, sample_metadata),
+            (sample_audio_data, second_metadata)
+        ])
+
+        assert len(saved_files) == 2
+        assert file_manager.transfer_manager.upload.call_count == 2
+        assert saved_files[1][1] == 'korean/LIGHTS_ON/lights_on_please_voice1.wav'
+        assert all(Path(local_path).read_bytes() == sample_audio_data for local_path, _ in saved_files)
+
+        # Both files share one cached directory descriptor
+        assert len(file_manager._dir_fds) <= 1
+        file_manager.close()
+        assert not file_manager._dir_fds
 
     def test_get_audio_file_local(self, file_manager, sample_audio_data):
         """
@@ -81,6 +188,21 @@ class TestFileManager:
         retrieved_data = file_manager.get_audio_file('test_audio.wav')
         assert retrieved_data == sample_audio_data
 
+    def test_open_audio_file_view(self, file_manager, sample_audio_data):
+        """
+        Test mapping a locally stored audio file without copying it.
+        Requirement: Scalable Data Management
+        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
+        """
+        (file_manager.local_base_path / 'test_audio.wav').write_bytes(sample_audio_data)
+        (file_manager.local_base_path / 'empty.wav').touch()
+
+        with file_manager.open_audio_file_view('test_audio.wav') as view:
+            assert bytes(view) == sample_audio_data
+            assert view.readonly
+        with file_manager.open_audio_file_view('empty.wav') as view:
+            assert bytes(view) == b''
+
     def test_get_audio_file_s3(self, file_manager, mock_s3_client, sample_audio_data):
         """
         Test retrieving an audio file from S3.
@@ -93,6 +215,28 @@ class TestFileManager:
         assert retrieved_data == sample_audio_data
         mock_s3_client.get_object.assert_called_once()
 
+    def test_get_audio_files_batch(self, file_manager, sample_audio_data):
+        """
+        Test that a batch of S3 downloads is submitted before any of them is awaited.
+        Requirement: Scalable Data Management
+        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
+        """
+        (file_manager.local_base_path / 'local.wav').write_bytes(b'local audio')
+        file_manager.transfer_manager = MagicMock()
+
+        def download(bucket, key, fileobj):
+            fileobj.write(key.encode())
+            return MagicMock()
+
+        file_manager.transfer_manager.download.side_effect = download
+        keys = [f'korean/LIGHTS_ON/file{i}.wav' for i in range(50)]
+
+        retrieved = file_manager.get_audio_files(['local.wav'] + keys)
+
+        assert retrieved[0] == b'local audio'
+        assert retrieved[1:] == [key.encode() for key in keys]
+        assert file_manager.transfer_manager.download.call_count == len(keys)
+
     def test_delete_audio_file(self, file_manager, mock_s3_client):
         """
         Test deleting an audio file from both local storage and S3.
@@ -114,42 +258,50 @@ class TestFileManager:
         Requirement: Structured Storage
         Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
         """
-        mock_s3_client.list_objects_v2.return_value = {
+        mock_s3_client.get_paginator.return_value.paginate.return_value = iter([{
             'Contents': [
                 {'Key': 'korean/LIGHTS_ON/file1.wav'},
                 {'Key': 'korean/LIGHTS_ON/file2.wav'}
             ]
-        }
+        }])
 
         file_list = file_manager.list_audio_files('LIGHTS_ON', 'korean')
 
         assert len(file_list) == 2
         assert 'korean/LIGHTS_ON/file1.wav' in file_list
         assert 'korean/LIGHTS_ON/file2.wav' in file_list
+        mock_s3_client.get_paginator.assert_called_once_with('list_objects_v2')
+        mock_s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket='test-bucket', Prefix='korean/LIGHTS_ON/', PaginationConfig={'PageSize': 1000}
+        )
 
-    def test_generate_file_path(self, file_manager, sample_metadata):
+    def test_list_audio_files_paginated(self, file_manager, mock_s3_client):
         """
-        Test the internal method for generating file paths.
+        Test that listings spanning several pages are returned completely.
         Requirement: Structured Storage
         Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
         """
-        file_path = file_manager._generate_file_path(sample_metadata)
-        expected_path = Path('korean/LIGHTS_ON/turn_on_lights_voice1.wav')
-        assert file_path == expected_path
+        keys = [f'korean/LIGHTS_ON/file{i}.wav' for i in range(2500)]
+        pages = [
+            {'Contents': [{'Key': key} for key in keys[start:start + 1000]], 'IsTruncated': start + 1000 < len(keys)}
+            for start in range(0, len(keys), 1000)
+        ]
+        mock_s3_client.get_paginator.return_value.paginate.return_value = iter(pages)
 
-    @patch('src.backend.src.utils.audio_converter.convert_to_wav')
-    def test_save_audio_file_conversion(self, mock_convert, file_manager, mock_s3_client, sample_audio_data, sample_metadata):
+        file_list = file_manager.list_audio_files('LIGHTS_ON', 'korean')
+
+        assert len(pages) == 3
+        assert file_list == keys
+
+    def test_generate_file_path(self, file_manager, sample_metadata):
         """
-        Test saving an audio file with format conversion.
-        Requirement: Audio Dataset Creation
-        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/2
+        Test the internal method for generating file paths.
+        Requirement: Structured Storage
+        Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
         """
-        sample_metadata['variation'] = 'test_conversion.m4a'
-        local_path, s3_path = file_manager.save_audio_file(sample_audio_data, sample_metadata)
-
-        assert local_path.endswith('.wav')
-        assert s3_path.endswith('.wav')
-        mock_convert.assert_called_once()
+        file_path, s3_key = file_manager._generate_file_path(sample_metadata)
+        assert file_path == Path('korean/LIGHTS_ON/turn_on_lights_voice1.wav')
+        assert s3_key == 'korean/LIGHTS_ON/turn_on_lights_voice1.wav'
 
     def test_save_audio_file_s3_error(self, file_manager, mock_s3_client, sample_audio_data, sample_metadata):
         """
@@ -157,7 +309,10 @@ class TestFileManager:
         Requirement: Scalable Data Management
         Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
         """
-        mock_s3_client.upload_file.side_effect = ClientError({'Error': {'Code': 'TestException'}}, 'upload_file')
+        file_manager.transfer_manager = MagicMock()
+        file_manager.transfer_manager.upload.return_value.result.side_effect = ClientError(
+            {'Error': {'Code': 'TestException'}}, 'upload_file'
+        )
 
         with pytest.raises(ClientError):
             file_manager.save_audio_file(sample_audio_data, sample_metadata)
@@ -179,7 +334,7 @@ class TestFileManager:
         Requirement: Structured Storage
         Location: Technical Specification/1.1 SYSTEM OBJECTIVES/3
         """
-        mock_s3_client.list_objects_v2.return_value = {}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = iter([{}])
 
         file_list = file_manager.list_audio_files('EMPTY_INTENT', 'korean')
 
@@ -5,15 +5,16 @@ from setuptools import setup, find_packages
 # Used for the long_description.  It's nice, because now 1) we have a top level
 # README file and 2) it's easier to type in the README file than to put a raw
 # string in below ...
+# Files are read as bytes and decoded as UTF-8, so the result does not depend on the locale
 def read(fname):
-    return open(os.path.join(os.path.dirname(__file__), fname)).read()
+    with open(os.path.join(os.path.dirname(__file__), fname), 'rb') as f:
+        return f.read().decode('utf-8')
 
 # Read version from a file
 VERSION = '0.1.0'
 
-# Read requirements from requirements.txt
-with open('requirements.txt') as f:
-    required = f.read().splitlines()
+# Read requirements from requirements.txt, next to this file rather than in the working directory
+required = read('requirements.txt').splitlines()
 
 setup(
     name="femtosense-voice-command-database",
@@ -1,6 +1,10 @@
 import os
+import logging
+import functools
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
 
 # Requirement: File Storage Configuration (Technical Specification/5.1 DEPLOYMENT ENVIRONMENT)
 # Define storage settings for both local and S3 storage
@@ -15,7 +19,7 @@ S3_BUCKET_NAME: str = os.getenv('FEMTOSENSE_S3_BUCKET', 'femtosense-voice-comman
 # AWS Region
 AWS_REGION: str = os.getenv('FEMTOSENSE_AWS_REGION', 'us-west-2')
 
-# File structure for S3 storage
+# File structure for S3 storage; get_s3_path builds paths of this shape directly
 # Requirement: File Structure Definition (Technical Specification/7.5 FILE STRUCTURE EXAMPLES)
 FILE_STRUCTURE: Dict[str, str] = {
     'bucket': '{bucket_name}',
@@ -73,12 +77,9 @@ class StorageConfig:
         Returns:
             str: The full S3 path for the audio file.
         """
-        return (
-            f"{self.file_structure['bucket'].format(bucket_name=self.s3_bucket)}/"
-            f"{self.file_structure['language'].format(language=language)}/"
-            f"{self.file_structure['intent'].format(intent=intent)}/"
-            f"{self.file_structure['variation'].format(phrase_variation=variation)}"
-        )
+        # Each FILE_STRUCTURE level is a single placeholder, so the path is the
+        # values joined directly instead of formatting four templates per call
+        return f"{self.s3_bucket}/{language}/{intent}/{variation}"
 
     def get_local_path(self, language: str, intent: str, variation: str) -> Path:
         """
@@ -110,8 +111,35 @@ class StorageConfig:
         if not self.local_root:
             raise ValueError("Local storage root is not configured")
 
-# Create a global instance of StorageConfig
-storage_config = StorageConfig()
+@functools.lru_cache(maxsize=1)
+def get_storage_config() -> StorageConfig:
+    """
+    Creates and validates the shared StorageConfig instance, once per process.
+
+    Returns:
+        StorageConfig: The validated storage configuration.
+
+    Raises:
+        ValueError: If any required configuration is missing.
+    """
+    config = StorageConfig()
+    config.validate_config()
+    logger.debug("Storage configuration validated successfully.")
+    return config
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolves the global storage_config instance on first access instead of at import time.
+
+    Args:
+        name (str): The module attribute being looked up.
 
-# Validate the configuration on module import
-storage_config.validate_config()
\ No newline at end of file
+    Returns:
+        Any: The validated StorageConfig for storage_config.
+
+    Raises:
+        AttributeError: For any other missing attribute.
+    """
+    if name == 'storage_config':
+        return get_storage_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
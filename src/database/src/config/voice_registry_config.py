@@ -8,8 +8,20 @@ This module addresses the following requirements:
 3. Structured Data Organization (3.2 HIGH-LEVEL ARCHITECTURE DIAGRAM): Organize voice profiles by language and region
 """
 
+import os
+import re
+import logging
+import functools
 from typing import Dict, List, Any
 
+# orjson parses the language mappings several times faster than the json module
+try:
+    from orjson import loads as _json_loads, JSONDecodeError
+except ImportError:
+    from json import loads as _json_loads, JSONDecodeError
+
+logger = logging.getLogger(__name__)
+
 # Define the structure for voice profiles
 class VoiceProfile:
     def __init__(self, name: str, language: str, region: str = None, gender: str = None):
@@ -18,8 +30,8 @@ class VoiceProfile:
         self.region = region
         self.gender = gender
 
-# Define the voice registry
-VOICE_REGISTRY: Dict[str, Dict[str, List[str]]] = {
+# Built-in voice registry, used when language_mappings.json is missing or invalid
+BUILTIN_VOICE_REGISTRY: Dict[str, Dict[str, List[str]]] = {
     "korean": {
         "default": [
             "Chae-Won", "Min-Ho", "Seo-Yeon", "Tae-Hee", "Joon-Gi",
@@ -51,6 +63,10 @@ DEFAULT_VOICES: Dict[str, str] = {
 # Define supported languages
 SUPPORTED_LANGUAGES: List[str] = ["korean", "english", "japanese"]
 
+# Allowed voice names, 'Name' or 'Name-Name'; MULTILINE lets one findall check
+# a newline-joined list of names, and fullmatch still checks a single name
+VOICE_NAME_PATTERN = re.compile(r'^[A-Z][a-z]+(?:-[A-Z][a-z]+)?$', re.MULTILINE)
+
 # Define voice quality settings
 VOICE_QUALITY_SETTINGS: Dict[str, Any] = {
     "sample_rate": 44100,
@@ -59,21 +75,22 @@ VOICE_QUALITY_SETTINGS: Dict[str, Any] = {
     "format": "wav"
 }
 
+@functools.lru_cache(maxsize=1)
 def load_language_mappings() -> Dict[str, Dict[str, List[str]]]:
     """
     Loads the language mappings from the JSON file and returns the structured voice registry dictionary.
 
+    The file is read and parsed once per process; later calls return the
+    same dictionary, which callers must not modify.
+
     Returns:
         Dict[str, Dict[str, List[str]]]: Structured voice registry dictionary
     """
-    import json
-    import os
-
     json_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'language_mappings.json')
     
     try:
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        with open(json_path, 'rb') as f:
+            data = _json_loads(f.read())
         
         # Validate the loaded data
         if not isinstance(data, dict):
@@ -88,14 +105,14 @@ def load_language_mappings() -> Dict[str, Dict[str, List[str]]]:
         
         return data
     except FileNotFoundError:
-        print(f"Warning: language_mappings.json not found at {json_path}. Using default VOICE_REGISTRY.")
-        return VOICE_REGISTRY
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in language_mappings.json. Using default VOICE_REGISTRY.")
-        return VOICE_REGISTRY
+        logger.warning(f"language_mappings.json not found at {json_path}. Using default VOICE_REGISTRY.")
+        return BUILTIN_VOICE_REGISTRY
+    except JSONDecodeError:
+        logger.error("Invalid JSON in language_mappings.json. Using default VOICE_REGISTRY.")
+        return BUILTIN_VOICE_REGISTRY
     except ValueError as e:
-        print(f"Error: {str(e)}. Using default VOICE_REGISTRY.")
-        return VOICE_REGISTRY
+        logger.error(f"{str(e)}. Using default VOICE_REGISTRY.")
+        return BUILTIN_VOICE_REGISTRY
 
 def validate_voice_config(config: Dict[str, Any]) -> bool:
     """
@@ -109,47 +126,99 @@ def validate_voice_config(config: Dict[str, Any]) -> bool:
     """
     # Check if all required languages are present
     if not all(lang in config for lang in SUPPORTED_LANGUAGES):
-        print("Error: Not all supported languages are present in the configuration.")
+        logger.error("Not all supported languages are present in the configuration.")
         return False
 
     # Verify structure of voice profiles for each language
     for lang, regions in config.items():
         if not isinstance(regions, dict):
-            print(f"Error: Invalid structure for language '{lang}'. Expected a dictionary of regions.")
+            logger.error(f"Invalid structure for language '{lang}'. Expected a dictionary of regions.")
             return False
         for region, voices in regions.items():
             if not isinstance(voices, list):
-                print(f"Error: Invalid structure for region '{region}' in language '{lang}'. Expected a list of voices.")
+                logger.error(f"Invalid structure for region '{region}' in language '{lang}'. Expected a list of voices.")
                 return False
 
-    # Validate voice names against allowed patterns
-    import re
-    voice_pattern = re.compile(r'^[A-Z][a-z]+(-[A-Z][a-z]+)?$')
+    # Validate voice names against allowed patterns in a single regex pass over all
+    # names; every line must match and no name may contain a line break
+    all_voices = [voice for regions in config.values() for voices in regions.values() for voice in voices]
+    voice_text = '\n'.join(all_voices)
+    if (len(VOICE_NAME_PATTERN.findall(voice_text)) == len(all_voices)
+            and voice_text.count('\n') == len(all_voices) - 1):
+        return True
+
+    # Some name is invalid; check them one by one to report it
     for lang, regions in config.items():
         for region, voices in regions.items():
             for voice in voices:
-                if not voice_pattern.match(voice):
-                    print(f"Error: Invalid voice name '{voice}' in {lang}/{region}. Must be in the format 'Name' or 'Name-Name'.")
+                if not VOICE_NAME_PATTERN.fullmatch(voice):
+                    logger.error(f"Invalid voice name '{voice}' in {lang}/{region}. Must be in the format 'Name' or 'Name-Name'.")
                     return False
 
     return True
 
-# Load the voice registry from JSON file
-VOICE_REGISTRY = load_language_mappings()
+@functools.lru_cache(maxsize=1)
+def _load_voice_registry() -> Dict[str, Dict[str, List[str]]]:
+    """
+    Loads and validates the voice registry, once per process.
 
-# Validate the loaded voice registry
-if not validate_voice_config(VOICE_REGISTRY):
-    print("Warning: Using default VOICE_REGISTRY due to validation errors.")
-    VOICE_REGISTRY = {
-        "korean": {"default": ["Chae-Won", "Min-Ho", "Seo-Yeon"]},
-        "english": {"us": ["Matt", "Linda"], "uk": ["Beatrice"]},
-        "japanese": {"default": ["Yuriko", "Akira", "Kasumi"]}
-    }
+    Falls back to a minimal registry if the loaded one is invalid, and
+    replaces any default voice missing from the registry with the first
+    available voice of its language. Languages without any voice in the
+    registry lose their default voice.
+
+    Returns:
+        Dict[str, Dict[str, List[str]]]: Structured voice registry dictionary
+    """
+    registry = load_language_mappings()
+
+    # Validate the loaded voice registry
+    if not validate_voice_config(registry):
+        logger.warning("Using default VOICE_REGISTRY due to validation errors.")
+        registry = {
+            "korean": {"default": ["Chae-Won", "Min-Ho", "Seo-Yeon"]},
+            "english": {"us": ["Matt", "Linda"], "uk": ["Beatrice"]},
+            "japanese": {"default": ["Yuriko", "Akira", "Kasumi"]}
+        }
+
+    # Ensure DEFAULT_VOICES are present in the registry
+    for lang, voice in list(DEFAULT_VOICES.items()):
+        lang_voices = [v for voices in registry.get(lang, {}).values() for v in voices]
+        if not lang_voices:
+            logger.warning(f"No voices for language '{lang}' in VOICE_REGISTRY. Removing its default voice '{voice}'.")
+            del DEFAULT_VOICES[lang]
+        elif voice not in lang_voices:
+            logger.warning(f"Default voice '{voice}' for language '{lang}' not found in VOICE_REGISTRY. Using first available voice.")
+            DEFAULT_VOICES[lang] = lang_voices[0]
+
+    logger.debug("Voice registry configuration loaded successfully.")
+    return registry
+
+def get_voice_registry() -> Dict[str, Dict[str, List[str]]]:
+    """
+    Returns the validated voice registry, loading it on first use.
+
+    Returns:
+        Dict[str, Dict[str, List[str]]]: Structured voice registry dictionary
+    """
+    return _load_voice_registry()
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolves VOICE_REGISTRY on first access instead of at import time.
+
+    The registry file is read and validated by get_voice_registry the first
+    time VOICE_REGISTRY is used, so importing this module does no I/O.
+
+    Args:
+        name (str): The module attribute being looked up
 
-# Ensure DEFAULT_VOICES are present in VOICE_REGISTRY
-for lang, voice in DEFAULT_VOICES.items():
-    if lang not in VOICE_REGISTRY or not any(voice in voices for voices in VOICE_REGISTRY[lang].values()):
-        print(f"Warning: Default voice '{voice}' for language '{lang}' not found in VOICE_REGISTRY. Using first available voice.")
-        DEFAULT_VOICES[lang] = next(iter(next(iter(VOICE_REGISTRY[lang].values()))))
+    Returns:
+        Any: The voice registry for VOICE_REGISTRY
 
-print("Voice registry configuration loaded successfully.")
\ No newline at end of file
+    Raises:
+        AttributeError: For any other missing attribute
+    """
+    if name == 'VOICE_REGISTRY':
+        return get_voice_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -12,7 +12,7 @@ Requirements addressed:
 
 import logging
 from typing import List, Dict, Optional
-from ..config.voice_registry_config import VOICE_REGISTRY, SUPPORTED_LANGUAGES, DEFAULT_VOICES, VoiceProfile
+from ..config.voice_registry_config import get_voice_registry, SUPPORTED_LANGUAGES, DEFAULT_VOICES, VoiceProfile
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -27,7 +27,8 @@ class LanguageManager:
         Initialize the LanguageManager with the supported languages and voice registry.
         """
         self.supported_languages = SUPPORTED_LANGUAGES
-        self.voice_registry = VOICE_REGISTRY
+        # Loaded on first use rather than when the config module is imported
+        self.voice_registry = get_voice_registry()
         self.default_voices = DEFAULT_VOICES
         logger.info(f"LanguageManager initialized with {len(self.supported_languages)} supported languages.")
 
@@ -81,9 +82,9 @@ class LanguageManager:
             return []
 
         voices = []
-        for region_voices in self.voice_registry[language.lower()].values():
+        for region_voices in self.voice_registry.get(language.lower(), {}).values():
             voices.extend(region_voices)
-        
+
         logger.info(f"Retrieved {len(voices)} voices for language '{language}'")
         return voices
 
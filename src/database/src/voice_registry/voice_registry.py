@@ -13,7 +13,7 @@ from typing import Dict, List, Optional
 import logging
 from .voice_profile import VoiceProfile
 from .language_manager import LanguageManager
-from ..config.voice_registry_config import VOICE_REGISTRY, SUPPORTED_LANGUAGES
+from ..config.voice_registry_config import get_voice_registry, SUPPORTED_LANGUAGES
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -52,7 +52,7 @@ class VoiceRegistry:
         """
         Load voice profiles from the VOICE_REGISTRY configuration.
         """
-        for language, regions in VOICE_REGISTRY.items():
+        for language, regions in get_voice_registry().items():
             for region, voices in regions.items():
                 for voice in voices:
                     profile = VoiceProfile(
@@ -1,3 +1,5 @@
+import random
+import string
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -7,7 +9,7 @@ from ..src.utils.file_validator import FileValidator
 from ..src.utils.path_generator import PathGenerator
 from ..src.models.audio_file import AudioFile
 from ..src.models.voice_command import VoiceCommand
-from ..src.config.storage_config import StorageConfig
+from ..src.config.storage_config import StorageConfig, FILE_STRUCTURE
 
 # Test FileValidator
 class TestFileValidator:
@@ -185,5 +187,25 @@ class TestPathGenerator:
         with pytest.raises(ValueError):
             path_generator.generate_path(mock_audio_file, "invalid_storage")
 
+# Test StorageConfig
+class TestStorageConfig:
+    def test_get_s3_path_matches_file_structure(self):
+        # The direct path must equal the FILE_STRUCTURE templates filled in level by level
+        config = StorageConfig()
+        rng = random.Random(0)
+        alphabet = string.ascii_letters + string.digits + '-_ {}'
+
+        for _ in range(1000):
+            language, intent, variation = (
+                ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))) for _ in range(3)
+            )
+            expected = '/'.join([
+                FILE_STRUCTURE['bucket'].format(bucket_name=config.s3_bucket),
+                FILE_STRUCTURE['language'].format(language=language),
+                FILE_STRUCTURE['intent'].format(intent=intent),
+                FILE_STRUCTURE['variation'].format(phrase_variation=variation)
+            ])
+            assert config.get_s3_path(language, intent, variation) == expected
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
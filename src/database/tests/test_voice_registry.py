@@ -3,7 +3,8 @@ from unittest.mock import patch, MagicMock
 from src.database.src.voice_registry.voice_registry import VoiceRegistry
 from src.database.src.voice_registry.voice_profile import VoiceProfile
 from src.database.src.voice_registry.language_manager import LanguageManager
-from src.database.src.config.voice_registry_config import VOICE_REGISTRY, SUPPORTED_LANGUAGES
+from src.database.src.config import voice_registry_config as registry_config
+from src.database.src.config.voice_registry_config import VOICE_REGISTRY, SUPPORTED_LANGUAGES, validate_voice_config
 
 # Test data
 TEST_VOICE_PROFILES = {
@@ -211,5 +212,43 @@ def test_voice_profile_compatibility(voice_registry):
     assert english_profile.is_compatible("english", "male") == True
     assert english_profile.is_compatible("english", "female") == False
 
+@pytest.mark.unit
+@pytest.mark.parametrize("voices,expected", [
+    (["Matt", "Chae-Won"], True),
+    (["Matt", "matt"], False),
+    (["Matt\nLinda", "x"], False)
+])
+def test_validate_voice_config_voice_names(voices, expected):
+    """
+    Tests that voice names are validated across all languages and regions.
+
+    Requirements addressed:
+    - Voice Profiles (1.1 SYSTEM OBJECTIVES/2)
+    """
+    config = {language: {"default": []} for language in SUPPORTED_LANGUAGES}
+    config["english"]["us"] = voices
+
+    assert validate_voice_config(config) == expected
+
+@pytest.mark.unit
+def test_load_voice_registry_without_voices_for_default_language():
+    """
+    Tests that a default language missing from the registry loses its default voice instead of failing to load.
+
+    Requirements addressed:
+    - Voice Profiles (1.1 SYSTEM OBJECTIVES/2)
+    """
+    registry = {"korean": {"default": ["Chae-Won"]}, "english": {"us": ["Linda"]}}
+    registry_config._load_voice_registry.cache_clear()
+    try:
+        with patch.object(registry_config, 'load_language_mappings', return_value=registry), \
+                patch.object(registry_config, 'validate_voice_config', return_value=True), \
+                patch.dict(registry_config.DEFAULT_VOICES):
+            registry_config._load_voice_registry()
+
+            assert registry_config.DEFAULT_VOICES == {"korean": "Chae-Won", "english": "Linda"}
+    finally:
+        registry_config._load_voice_registry.cache_clear()
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file